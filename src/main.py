@@ -1,7 +1,8 @@
 import json
 import tkinter as tk
-from model.planet_class import WatorPlanet
-from model.recorder_json import run_and_record_json
+from model.backends import create_backend
+from model.recorder_json import run_and_record, OUTPUT_FORMATS
+from model.sampling import SAMPLING_MODES
 from model.simulation_graphique import WatorViewer
 
 def export_to_json(world, filename: str = "simulation_data.json") -> None:
@@ -57,7 +58,7 @@ def export_to_json_compact(world, filename: str = "simulation_data_compact.json"
     print(f"✓ Données compactes exportées dans '{filename}'")
 
 
-def simulation(num_chronons: int, width: int, height: int):
+def simulation(num_chronons: int, width: int, height: int, backend: str = "reference"):
     """
     Run a WA-TOR predator-prey simulation for a specified number of chronons (time steps).
 
@@ -70,12 +71,15 @@ def simulation(num_chronons: int, width: int, height: int):
         num_chronons (int): Number of time steps (chronons) to simulate.
         width (int): Width of the simulation grid.
         height (int): Height of the simulation grid.
+        backend (str, optional): Simulation backend, one of model.backends.BACKENDS.
+            Defaults to "reference".
 
     Returns:
-        WatorPlanet: The final state of the WA-TOR world after the simulation.
+        WatorBackend: The final state of the WA-TOR world after the simulation.
     """
 
-    world = WatorPlanet(
+    world = create_backend(
+        backend,
         width=int(width),
         height=int(height),
         perc_fish=0.5,
@@ -86,17 +90,18 @@ def simulation(num_chronons: int, width: int, height: int):
     print("WA-TOR SIMULATION")
     print("=" * 50)
     print("Initial grid:")
-    print(world.grid)
+    print(world.render())
     print(f"Fish: {world.fish_population} | Sharks: {world.shark_population}")
     print(f"Chronon: {world.chronon}\n")
     
     for i in range(int(num_chronons)):
-        world.movement_result()
+        world.step(1)
         #export_to_json(world)
         print("=" * 50)
         print(f"Chronon {world.chronon}:")
-        print(world.grid)
+        print(world.render())
         print(f"Fish: {world.fish_population} | Sharks: {world.shark_population}")
+    world.close()
     print("\nSimulation complete!")
     return world
 
@@ -105,21 +110,38 @@ def main():
     Main function to run the WA-TOR simulation and visualization.
 
     This function prompts the user for simulation parameters (number of chronons, grid width, and height),
-    runs the simulation, records the results in a JSON file, and launches the graphical viewer
+    runs the simulation, records the results in the chosen format, and launches the graphical viewer
     to visualize the simulation.
 
     Steps:
-        1. Prompts the user for the number of chronons, grid width, and grid height.
+        1. Prompts the user for the number of chronons, grid width, grid height, output format
+           and, for binary recordings, the recording policy (model.sampling).
+           With the "live" output format, the simulation is shown as it runs instead
+           (WatorViewer.start_live) and steps 2-3 are skipped.
         2. Runs the simulation with the provided parameters.
-        3. Records the simulation results in a JSON file.
+        3. Records the simulation results in the chosen format (model.recorder_json.run_and_record).
         4. Launches the graphical viewer to display the simulation.
     """
 
     number_of_chronon = input('How many chronon  :')
     number_width = input('How many width  :')
     number_height = input('How many height  :')
+    output_format = input(f'Output format {OUTPUT_FORMATS + ("live",)} [binary] :').strip() or "binary"
+    if output_format == "live":
+        root = tk.Tk()
+        app = WatorViewer(root)
+        app.start_live(create_backend("fast", int(number_width), int(number_height), 0.5, 0.05),
+                       int(number_of_chronon))
+        app.root.mainloop()
+        app.stop_live()
+        return
+    options = {}
+    if output_format != "json":
+        options["sampling"] = input(f'Recording policy {SAMPLING_MODES} [every] :').strip() or "every"
+        if options["sampling"] in ("stride", "adaptive"):
+            options["stride"] = int(input('Stride in chronons [50] :').strip() or 50)
     simulation(number_of_chronon, number_width, number_height)
-    run_and_record_json(number_width, number_height, number_of_chronon)
+    run_and_record(number_width, number_height, number_of_chronon, output_format, **options)
     root = tk.Tk()
     app = WatorViewer(root)  
     app.root.mainloop()
@@ -0,0 +1,92 @@
+"""
+Interchangeable simulation backends.
+
+Every backend is built from the same parameters and exposes the same calls, so the recorder,
+the command line and the viewer do not need to know which engine runs the world:
+
+- "reference": WatorPlanet with the sequential engine, one animal at a time in a shuffled
+  order. It defines the rules the other backends are measured against.
+- "fast": WatorPlanet with the vectorized engine (whole-array updates).
+- "sublattice": WatorPlanet updated one color of independent cells at a time.
+- "parallel": ParallelWatorPlanet, strips of the grid run by worker processes.
+"""
+
+from typing import Protocol, runtime_checkable
+
+import numpy as np
+
+from .planet_class import WatorPlanet
+from .parallel_planet import ParallelWatorPlanet
+
+
+@runtime_checkable
+class WatorBackend(Protocol):
+    """
+    The calls every simulation backend provides.
+
+    Attributes:
+        width (int): Width of the simulation grid.
+        height (int): Height of the simulation grid.
+        chronon (int): Current time step (chronon) of the simulation.
+        grid (np.ndarray): The uint8 grid (EMPTY, FISH or SHARK per cell). Read-only for callers.
+        fish_population (int): Current number of fish in the simulation.
+        shark_population (int): Current number of sharks in the simulation.
+        fish_history (list): Historical record of fish population counts over time.
+        shark_history (list): Historical record of shark population counts over time.
+    """
+
+    width: int
+    height: int
+    chronon: int
+    grid: np.ndarray
+    fish_population: int
+    shark_population: int
+    fish_history: list
+    shark_history: list
+
+    def step(self, count: int = 1) -> None: ...
+
+    def render(self) -> np.ndarray: ...
+
+    def take_changes(self) -> np.ndarray: ...
+
+    def export_state(self) -> dict: ...
+
+    def close(self) -> None: ...
+
+
+BACKENDS = ("reference", "fast", "sublattice", "parallel")
+
+
+def create_backend(name: str,
+                   width: int,
+                   height: int,
+                   perc_fish: float,
+                   perc_shark: float,
+                   rng: np.random.Generator | int | None = None,
+                   **options) -> WatorBackend:
+    """
+    Build a simulation backend by name.
+
+    Args:
+        name (str): One of BACKENDS.
+        width (int): Width of the simulation grid.
+        height (int): Height of the simulation grid.
+        perc_fish (float): Percentage of the grid initially populated with fish.
+        perc_shark (float): Percentage of the grid initially populated with sharks.
+        rng (np.random.Generator | int | None, optional): Random generator or seed.
+        **options: Backend specific options, e.g. `workers` for "parallel".
+
+    Returns:
+        WatorBackend: The new world. Call close() when done with it.
+
+    Raises:
+        ValueError: If the backend name is unknown.
+    """
+
+    if name == "parallel":
+        return ParallelWatorPlanet(width, height, perc_fish, perc_shark, rng=rng, **options)
+    engines = {"reference": "sequential", "fast": "vectorized", "sublattice": "sublattice"}
+    if name not in engines:
+        raise ValueError(f"Unknown backend {name!r}, expected one of {BACKENDS}")
+    return WatorPlanet(width, height, perc_fish, perc_shark, rng=rng, engine=engines[name], **options)
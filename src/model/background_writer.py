@@ -0,0 +1,152 @@
+"""
+Write recordings from a background thread.
+
+The simulation loop only copies each frame into a bounded queue; a writer thread encodes
+(packing, deltas, compression) and writes it. When the writer falls behind, the "block" policy
+makes the simulation wait for room in the queue, while the "drop" policy skips the frame. The
+cells touched by dropped frames are carried over to the next queued frame, so the deltas of the
+recording stay valid, and a dropped last frame is still written when the writer is closed, so
+recordings always end with the last submitted frame.
+"""
+
+import queue
+import threading
+import time
+
+import numpy as np
+
+POLICIES = ("block", "drop")
+
+
+class BackgroundWriter:
+    """
+    Feed a RecordingWriter (or anything with the same write_frame/close methods) from a
+    writer thread.
+
+    Attributes:
+        writer: The wrapped writer, only used by the writer thread until close().
+        policy (str): "block" or "drop", what to do with a frame when the queue is full.
+        submitted (int): Frames handed to write_frame.
+        written (int): Frames written by the writer thread.
+        dropped (int): Frames skipped because the queue was full.
+        max_depth (int): Largest number of frames seen waiting in the queue.
+    """
+
+    def __init__(self, writer, queue_size: int = 64, policy: str = "block"):
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown policy {policy!r}, expected one of {POLICIES}")
+        self.writer = writer
+        self.policy = policy
+        self.queue = queue.Queue(maxsize=max(1, int(queue_size)))
+        self.submitted = 0
+        self.written = 0
+        self.dropped = 0
+        self.max_depth = 0
+        self.total_lag = 0.0
+        self.max_lag = 0.0
+        self.carry = None
+        self.resync = False
+        self.last_dropped = None
+        self.error = None
+        self.thread = threading.Thread(target=self.run, name="wator-writer", daemon=True)
+        self.thread.start()
+
+    @property
+    def frame_count(self) -> int:
+        return self.written
+
+    def write_frame(self, chronon: int, fish: int, sharks: int, grid: np.ndarray,
+                    changes: np.ndarray | None = None) -> None:
+        """
+        Queue a frame for writing. Same arguments as RecordingWriter.write_frame.
+
+        The grid and changes are copied, so the caller can keep updating them.
+        """
+
+        if self.error is not None:
+            raise self.error
+        if self.resync:
+            changes = None
+        elif changes is not None and self.carry is not None:
+            changes = np.union1d(self.carry, changes)
+        frame = (time.perf_counter(), chronon, fish, sharks, np.array(grid, dtype=np.uint8),
+                 None if changes is None else np.array(changes))
+        self.submitted += 1
+
+        if self.policy == "block":
+            self.queue.put(frame)
+        else:
+            try:
+                self.queue.put_nowait(frame)
+            except queue.Full:
+                self.dropped += 1
+                self.last_dropped = frame
+                if changes is None:
+                    self.resync = True
+                else:
+                    self.carry = frame[5]
+                return
+        self.last_dropped = None
+        self.carry = None
+        self.resync = False
+        self.max_depth = max(self.max_depth, self.queue.qsize())
+
+    def run(self) -> None:
+        while True:
+            frame = self.queue.get()
+            if frame is None:
+                return
+            if self.error is not None:
+                continue
+            submitted_at, *arguments = frame
+            try:
+                self.writer.write_frame(*arguments)
+            except Exception as error:
+                self.error = error
+                continue
+            lag = time.perf_counter() - submitted_at
+            self.written += 1
+            self.total_lag += lag
+            self.max_lag = max(self.max_lag, lag)
+
+    def stats(self) -> dict:
+        """
+        Return the queue and writer statistics.
+
+        Returns:
+            dict: Frames submitted, written and dropped, current and largest queue depth, and
+                mean and largest writer lag (seconds between queuing and writing a frame).
+        """
+
+        return {
+            "submitted": self.submitted,
+            "written": self.written,
+            "dropped": self.dropped,
+            "queue_depth": self.queue.qsize(),
+            "max_queue_depth": self.max_depth,
+            "mean_lag": self.total_lag / self.written if self.written else 0.0,
+            "max_lag": self.max_lag,
+        }
+
+    def close(self) -> None:
+        """
+        Write the queued frames, and the last submitted one if it was dropped, stop the writer
+        thread and close the wrapped writer.
+        """
+
+        if self.thread.is_alive():
+            if self.last_dropped is not None:
+                self.queue.put(self.last_dropped)
+                self.dropped -= 1
+                self.last_dropped = None
+            self.queue.put(None)
+            self.thread.join()
+        self.writer.close()
+        if self.error is not None:
+            raise self.error
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,94 @@
+import numpy as np
+
+EMPTY = 0
+FISH = 1
+SHARK = 2
+
+CELL_CHARS = np.array([" ", "F", "S"])
+
+
+def to_chars(grid: np.ndarray) -> np.ndarray:
+    """
+    Render an integer-coded grid as the legacy one-character cells (" ", "F", "S").
+
+    Only used at the edges of the program: printing, JSON export and display.
+
+    Args:
+        grid (np.ndarray): A grid of EMPTY, FISH and SHARK codes.
+
+    Returns:
+        np.ndarray: A unicode array of the same shape.
+    """
+
+    return CELL_CHARS[grid]
+
+
+def from_chars(grid) -> np.ndarray:
+    """
+    Convert a grid of one-character cells (" ", "F", "S") to integer codes.
+
+    Unknown characters are treated as empty cells.
+
+    Args:
+        grid: A nested list or array of one-character strings.
+
+    Returns:
+        np.ndarray: A uint8 array of EMPTY, FISH and SHARK codes.
+    """
+
+    chars = np.asarray(grid)
+    codes = np.full(chars.shape, EMPTY, dtype=np.uint8)
+    codes[chars == "F"] = FISH
+    codes[chars == "S"] = SHARK
+    return codes
+
+
+CELLS_PER_BYTE = 4
+UNPACK_TABLE = (np.arange(256, dtype=np.uint8)[:, None] >> np.array([0, 2, 4, 6], dtype=np.uint8)) & 3
+
+
+def packed_size(count: int) -> int:
+    """
+    Number of bytes needed to pack `count` cells at 2 bits per cell.
+    """
+
+    return (count + CELLS_PER_BYTE - 1) // CELLS_PER_BYTE
+
+
+def pack_cells(cells: np.ndarray) -> np.ndarray:
+    """
+    Pack cell codes at 2 bits per cell, 4 cells per byte, first cell in the lowest bits.
+
+    Args:
+        cells (np.ndarray): EMPTY, FISH and SHARK codes, of any shape (read in C order).
+
+    Returns:
+        np.ndarray: A flat uint8 array of packed_size(cells.size) bytes.
+    """
+
+    flat = np.ascontiguousarray(cells, dtype=np.uint8).reshape(-1)
+    padding = -flat.size % CELLS_PER_BYTE
+    if padding:
+        flat = np.concatenate([flat, np.zeros(padding, dtype=np.uint8)])
+    quads = flat.reshape(-1, CELLS_PER_BYTE)
+    return quads[:, 0] | quads[:, 1] << 2 | quads[:, 2] << 4 | quads[:, 3] << 6
+
+
+def unpack_cells(packed: np.ndarray, count: int, out: np.ndarray | None = None) -> np.ndarray:
+    """
+    Unpack cell codes packed by pack_cells().
+
+    Args:
+        packed (np.ndarray): The packed uint8 bytes.
+        count (int): Number of cells to unpack.
+        out (np.ndarray | None, optional): Flat uint8 array of `count` cells to unpack into.
+
+    Returns:
+        np.ndarray: A flat uint8 array of `count` cell codes (`out` when given).
+    """
+
+    cells = UNPACK_TABLE[np.asarray(packed, dtype=np.uint8)[:packed_size(count)]].reshape(-1)[:count]
+    if out is None:
+        return cells
+    out[:] = cells
+    return out
@@ -0,0 +1,139 @@
+"""
+Full-state checkpoints of a WatorPlanet.
+
+A checkpoint is a compressed .npz file holding everything the simulation depends on: the grid,
+the occupancy index, every column of the entity store with its activation order and free list,
+the chronon, the populations and their histories, and the state of the random generator. A
+planet loaded from a checkpoint continues exactly as the saved one would have.
+
+Loading with another random generator forks the run: many variants can be started from the
+same warmed-up state.
+"""
+
+import json
+import os
+
+import numpy as np
+
+from .entity_store import EntityStore
+from .planet_class import WatorPlanet
+
+FORMAT_VERSION = 1
+
+
+def save_checkpoint(planet: WatorPlanet, path: str) -> str:
+    """
+    Save the full state of a planet.
+
+    The file is written next to its destination first and then renamed, so an interrupted
+    save never leaves a truncated checkpoint behind.
+
+    Args:
+        planet (WatorPlanet): The planet to save.
+        path (str): Destination file, usually ending with .npz.
+
+    Returns:
+        str: The path of the checkpoint.
+
+    Raises:
+        TypeError: If `planet` is not a WatorPlanet (other backends cannot be checkpointed).
+    """
+
+    if not isinstance(planet, WatorPlanet):
+        raise TypeError(f"Only WatorPlanet can be checkpointed, not {type(planet).__name__}")
+
+    arrays = {f"store_{name}": array for name, array in planet.store.export_arrays().items()}
+    arrays.update(
+        format_version=np.array(FORMAT_VERSION),
+        parameters=np.array(json.dumps({
+            "width": planet.width,
+            "height": planet.height,
+            "perc_fish": planet.perc_fish,
+            "perc_shark": planet.perc_shark,
+            "engine": planet.engine,
+            "empty_spaces": planet.empty_spaces,
+            "chronon": planet.chronon,
+            "fish_population": planet.fish_population,
+            "shark_population": planet.shark_population,
+            "draw_count": planet._draw_count,
+            "draw_cursor": planet._draw_cursor,
+        })),
+        rng_state=np.array(json.dumps(planet.rng.bit_generator.state)),
+        draws=planet._draws,
+        grid=planet.grid,
+        occupancy=planet.occupancy,
+        fish_history=np.array(planet.fish_history, dtype=np.int64),
+        shark_history=np.array(planet.shark_history, dtype=np.int64),
+    )
+
+    temporary = path + ".tmp"
+    with open(temporary, "wb") as f:
+        np.savez_compressed(f, **arrays)
+    os.replace(temporary, path)
+    return path
+
+
+def load_checkpoint(path: str, rng: np.random.Generator | int | None = None) -> WatorPlanet:
+    """
+    Restore a planet saved by save_checkpoint().
+
+    Args:
+        path (str): The checkpoint file.
+        rng (np.random.Generator | int | None, optional): Random generator or seed for a forked
+            run. By default the saved generator state is restored, so the run continues exactly.
+
+    Returns:
+        WatorPlanet: The restored planet.
+
+    Raises:
+        ValueError: If the file is not a checkpoint of a supported version.
+    """
+
+    with np.load(path) as data:
+        if "format_version" not in data or int(data["format_version"]) != FORMAT_VERSION:
+            raise ValueError(f"{path} is not a supported WA-TOR checkpoint")
+        parameters = json.loads(str(data["parameters"]))
+        planet = WatorPlanet(parameters["width"], parameters["height"], 0.0, 0.0,
+                             engine=parameters["engine"])
+        planet.perc_fish = parameters["perc_fish"]
+        planet.perc_shark = parameters["perc_shark"]
+        planet.empty_spaces = parameters["empty_spaces"]
+        planet.chronon = parameters["chronon"]
+        planet.fish_population = parameters["fish_population"]
+        planet.shark_population = parameters["shark_population"]
+        planet.fish_history = data["fish_history"].tolist()
+        planet.shark_history = data["shark_history"].tolist()
+
+        planet.grid[:] = data["grid"]
+        planet.occupancy[:] = data["occupancy"]
+        planet.store = EntityStore.from_arrays(
+            planet.width, {name[len("store_"):]: data[name] for name in data.files if name.startswith("store_")})
+
+        if rng is None:
+            state = json.loads(str(data["rng_state"]))
+            bit_generator = getattr(np.random, state["bit_generator"])()
+            bit_generator.state = state
+            planet.rng = np.random.Generator(bit_generator)
+            planet._draws = data["draws"].copy()
+            planet._draw_count = parameters["draw_count"]
+            planet._draw_cursor = parameters["draw_cursor"]
+        else:
+            planet.rng = np.random.default_rng(rng)
+    return planet
+
+
+def fork_checkpoint(path: str, count: int, seed: int | None = None) -> list[WatorPlanet]:
+    """
+    Start `count` variant runs from the same checkpoint, each with its own random generator.
+
+    Args:
+        path (str): The checkpoint file.
+        count (int): Number of variants.
+        seed (int | None, optional): Seed of the variants' generators, for reproducible forks.
+
+    Returns:
+        list[WatorPlanet]: The variants.
+    """
+
+    seeds = np.random.SeedSequence(seed).spawn(int(count))
+    return [load_checkpoint(path, rng=np.random.default_rng(variant_seed)) for variant_seed in seeds]
@@ -0,0 +1,237 @@
+"""
+Chunked, compressed WA-TOR recordings.
+
+Frames are encoded as in model.recording (keyframes, delta frames, packed cells), grouped into
+chunks of `chunk_frames` frames, and every chunk is compressed on its own with zlib or lzma.
+Each chunk starts with a keyframe, so any chunk can be decompressed and decoded without the
+others: the viewer only inflates the chunk of the frame it shows, and analysis scripts can
+decode chunks in parallel (decode_chunks).
+
+Layout (little-endian):
+
+- header: magic b"WATC", format version (uint16), flags (uint16, PACKED_CELLS), codec (uint16,
+  CODECS), chunk_frames, width, height and number of frames (uint32), offset of the index
+  (uint64). The number of frames and the index offset are written when the recording is closed.
+- chunks: the compressed records (see model.recording.RECORD) of consecutive frames.
+- index: one CHUNK_ENTRY per chunk (offset and compressed size of the chunk), then the chronon,
+  fish and shark counts of every frame as three uint32 arrays.
+"""
+
+import lzma
+import struct
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .recording import RECORD, FULL_FRAME, PACKED_CELLS, RecordingWriter, apply_record
+
+MAGIC = b"WATC"
+VERSION = 1
+HEADER = struct.Struct("<4sHHHIIIIQ")
+CHUNK_ENTRY = struct.Struct("<QQ")
+CHUNK_FRAMES = 64
+
+CODECS = {"zlib": 0, "lzma": 1}
+COMPRESSORS = {
+    0: (lambda data: zlib.compress(data, 6), zlib.decompress),
+    1: (lambda data: lzma.compress(data, preset=6), lzma.decompress),
+}
+
+
+class ChunkedRecordingWriter(RecordingWriter):
+    """
+    Write frames into independently compressed chunks.
+
+    Frames are encoded like RecordingWriter frames and buffered until a chunk is full, then the
+    chunk is compressed and written.
+
+    Attributes:
+        codec (str): "zlib" or "lzma".
+        chunk_frames (int): Number of frames per chunk.
+    """
+
+    def __init__(self, path: str, width: int, height: int, keyframe_interval: int = CHUNK_FRAMES,
+                 packed: bool = True, codec: str = "zlib", chunk_frames: int = CHUNK_FRAMES):
+        if codec not in CODECS:
+            raise ValueError(f"Unknown codec {codec!r}, expected one of {tuple(CODECS)}")
+        self.codec = codec
+        self.chunk_frames = max(1, int(chunk_frames))
+        self.chunk = bytearray()
+        self.chunks = bytearray()
+        self.populations = bytearray()
+        super().__init__(path, width, height, keyframe_interval, packed)
+
+    def write_header(self, index_offset: int = 0) -> None:
+        flags = PACKED_CELLS if self.packed else 0
+        self.file.write(HEADER.pack(MAGIC, VERSION, flags, CODECS[self.codec], self.chunk_frames,
+                                    self.width, self.height, self.frame_count, index_offset))
+
+    def write_frame(self, chronon: int, fish: int, sharks: int, grid: np.ndarray,
+                    changes: np.ndarray | None = None) -> None:
+        if self.frame_count % self.chunk_frames == 0:
+            changes = None
+        super().write_frame(chronon, fish, sharks, grid, changes)
+
+    def write_record(self, kind: int, chronon: int, fish: int, sharks: int, payload) -> None:
+        payload = memoryview(payload).cast("B")
+        self.chunk += RECORD.pack(kind, chronon, fish, sharks, payload.nbytes)
+        self.chunk += payload
+        self.populations += struct.pack("<III", chronon, fish, sharks)
+        self.frame_count += 1
+        if self.frame_count % self.chunk_frames == 0:
+            self.flush_chunk()
+
+    def flush_chunk(self) -> None:
+        if not self.chunk:
+            return
+        compressed = COMPRESSORS[CODECS[self.codec]][0](bytes(self.chunk))
+        self.chunks += CHUNK_ENTRY.pack(self.file.tell(), len(compressed))
+        self.file.write(compressed)
+        self.chunk = bytearray()
+
+    def close(self) -> None:
+        """
+        Write the last chunk, the index, the frame count and the index offset, and close the file.
+        """
+
+        if self.file.closed:
+            return
+        self.flush_chunk()
+        index_offset = self.file.tell()
+        self.file.write(self.chunks)
+        populations = np.frombuffer(bytes(self.populations), dtype="<u4").reshape(-1, 3)
+        self.file.write(np.ascontiguousarray(populations.T).tobytes())
+        self.file.seek(0)
+        self.write_header(index_offset)
+        self.file.close()
+
+
+class ChunkedRecordingReader:
+    """
+    Random access to the frames of a chunked recording.
+
+    Only the header and index are read on opening. The most recently used chunk is kept
+    decoded, so playback decompresses each chunk once.
+
+    Attributes:
+        path (str): Path of the recording.
+        width (int): Width of the recorded grid.
+        height (int): Height of the recorded grid.
+        frame_count (int): Number of frames in the recording.
+        chunk_frames (int): Number of frames per chunk.
+        packed (bool): Whether cell codes are packed at 2 bits per cell.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            (magic, version, flags, codec, self.chunk_frames, self.width, self.height,
+             self.frame_count, index_offset) = HEADER.unpack(f.read(HEADER.size))
+            if magic != MAGIC:
+                raise ValueError(f"{path} is not a chunked WA-TOR recording")
+            if version != VERSION:
+                raise ValueError(f"Unsupported recording version {version} in {path}")
+            chunk_count = -(-self.frame_count // self.chunk_frames)
+            f.seek(index_offset)
+            entries = np.frombuffer(f.read(chunk_count * CHUNK_ENTRY.size), dtype="<u8").reshape(-1, 2)
+            populations = np.frombuffer(f.read(3 * 4 * self.frame_count), dtype="<u4")
+        self.packed = bool(flags & PACKED_CELLS)
+        self.codec = codec
+        self.chunk_offsets = entries[:, 0].tolist()
+        self.chunk_sizes = entries[:, 1].tolist()
+        self.chronons, self.fish, self.sharks = (array.tolist() for array in populations.reshape(3, -1))
+        self.cached_chunk = -1
+        self.cached_frames = None
+
+    def __len__(self) -> int:
+        return self.frame_count
+
+    def read_chunk(self, chunk: int) -> bytes:
+        with open(self.path, "rb") as f:
+            f.seek(self.chunk_offsets[chunk])
+            return COMPRESSORS[self.codec][1](f.read(self.chunk_sizes[chunk]))
+
+    def decode_chunk(self, chunk: int) -> np.ndarray:
+        """
+        Decompress and decode every frame of a chunk.
+
+        Args:
+            chunk (int): Index of the chunk.
+
+        Returns:
+            np.ndarray: The (frames, height, width) grids of the chunk.
+        """
+
+        data = np.frombuffer(self.read_chunk(chunk), dtype=np.uint8)
+        count = min(self.chunk_frames, self.frame_count - chunk * self.chunk_frames)
+        frames = np.empty((count, self.height, self.width), dtype=np.uint8)
+        cells = np.zeros(self.width * self.height, dtype=np.uint8)
+        offset = 0
+        for index in range(count):
+            kind, _chronon, _fish, _sharks, size = RECORD.unpack_from(data, offset)
+            if index == 0 and kind != FULL_FRAME:
+                raise ValueError(f"Chunk {chunk} of {self.path} does not start with a keyframe")
+            offset += RECORD.size
+            apply_record(cells, kind, data[offset:offset + size], self.packed)
+            frames[index] = cells.reshape(self.height, self.width)
+            offset += size
+        return frames
+
+    def frame(self, index: int) -> np.ndarray:
+        """
+        Decode a frame.
+
+        Args:
+            index (int): Index of the frame, from 0 to frame_count - 1.
+
+        Returns:
+            np.ndarray: The (height, width) grid of cell codes, owned by the chunk cache.
+        """
+
+        if not 0 <= index < self.frame_count:
+            raise IndexError(f"Frame {index} out of range (0-{self.frame_count - 1})")
+        chunk = index // self.chunk_frames
+        if chunk != self.cached_chunk:
+            self.cached_frames = self.decode_chunk(chunk)
+            self.cached_chunk = chunk
+        return self.cached_frames[index % self.chunk_frames]
+
+    def populations(self) -> tuple[list[int], list[int]]:
+        """
+        Return the fish and shark populations of every frame, from the index.
+        """
+
+        return self.fish, self.sharks
+
+    def __iter__(self):
+        """
+        Yield (chronon, fish, sharks, grid) for every frame, in order.
+        """
+
+        for index in range(self.frame_count):
+            yield self.chronons[index], self.fish[index], self.sharks[index], self.frame(index)
+
+
+def decode_chunk(path: str, chunk: int) -> np.ndarray:
+    return ChunkedRecordingReader(path).decode_chunk(chunk)
+
+
+def decode_chunks(path: str, chunks=None, processes: int | None = None):
+    """
+    Decode chunks of a recording in parallel over a process pool.
+
+    Args:
+        path (str): Path of the recording.
+        chunks (iterable of int, optional): Chunks to decode. Defaults to all of them.
+        processes (int | None, optional): Number of worker processes. Defaults to the CPU count.
+
+    Yields:
+        tuple[int, np.ndarray]: Each chunk index with its (frames, height, width) grids, in order.
+    """
+
+    if chunks is None:
+        chunks = range(len(ChunkedRecordingReader(path).chunk_offsets))
+    chunks = list(chunks)
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        yield from zip(chunks, pool.map(decode_chunk, [path] * len(chunks), chunks))
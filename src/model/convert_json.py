@@ -0,0 +1,244 @@
+"""
+Convert legacy JSON histories to binary recordings (see model.recording).
+
+Both layouts read by WatorViewer.load_json are supported:
+{"history": [grid0, grid1, ...]} and {"frames": [{"grid": grid0, "fish": n, "sharks": m}, ...]}.
+The document is never loaded as a whole: it is read in chunks and each frame is decoded on its
+own with json.JSONDecoder.raw_decode, so memory use stays bounded by one frame whatever the
+size of the file.
+
+Population counts are stored in the recording (taken from the frames when present, counted
+otherwise). Legacy files have no engine bookkeeping, so delta frames list the cells that differ
+from the previous frame.
+
+Usage (from src/):
+    python -m model.convert_json wator_history_grid_....json [-o out.wtr] [--keyframe-interval K]
+"""
+
+import argparse
+import json
+import os
+import re
+import time
+
+import numpy as np
+
+from .cells import FISH, SHARK, from_chars
+from .recording import RecordingWriter
+
+CHUNK_SIZE = 1 << 20
+WHITESPACE = " \t\n\r"
+NUMBER_CHARS = "0123456789+-.eE"
+BRACKETS = re.compile(r"[\[\]{}]")
+
+
+class JsonStream:
+    """
+    Incremental reader of a JSON document: values are decoded one at a time from a buffer
+    refilled by chunks, and the consumed part of the buffer is dropped.
+    """
+
+    def __init__(self, file, chunk_size: int = CHUNK_SIZE):
+        self.file = file
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        """
+        Read one more chunk. Returns False at the end of the file.
+        """
+
+        if self.eof:
+            return False
+        chunk = self.file.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """
+        Skip whitespace and return the next character ("" at the end of the document).
+        """
+
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer) or not self.fill():
+                return self.buffer[self.pos:self.pos + 1]
+
+    def expect(self, chars: str) -> str:
+        char = self.peek()
+        if not char or char not in chars:
+            raise ValueError(f"Expected one of {chars!r}, found {char!r}")
+        self.pos += 1
+        return char
+
+    def container_end(self) -> int:
+        """
+        Read until the array or object starting at the current position is entirely in the
+        buffer, and return the position just after it.
+
+        Brackets are counted without parsing the strings, which is safe because the strings of
+        WA-TOR histories are cell characters. The chunks are joined once, when the end is found,
+        so reading a value that spans many chunks takes linear time.
+        """
+
+        parts = [self.buffer[self.pos:]]
+        length = 0
+        depth = 0
+        while True:
+            for match in BRACKETS.finditer(parts[-1]):
+                depth += 1 if match.group() in "[{" else -1
+                if depth == 0:
+                    self.buffer = "".join(parts)
+                    self.pos = 0
+                    return length + match.end()
+            length += len(parts[-1])
+            chunk = self.file.read(self.chunk_size)
+            if not chunk:
+                self.eof = True
+                raise ValueError("Unterminated JSON array or object")
+            parts.append(chunk)
+
+    def value(self):
+        """
+        Decode the next JSON value.
+
+        Arrays and objects are decoded once their closing bracket has been read (see
+        container_end). A scalar followed by the end of the buffer or by a character that could
+        continue a number ("1" of "1.5") may be truncated, so it is only accepted once another
+        character (or the end of the file) follows it.
+        """
+
+        if self.peek() in ("[", "{"):
+            self.container_end()
+            value, self.pos = self.decoder.raw_decode(self.buffer, self.pos)
+            return value
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+                if self.eof or (end < len(self.buffer) and self.buffer[end] not in NUMBER_CHARS):
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            self.fill()
+
+    def items(self):
+        """
+        Iterate over the keys of an object. The consumer reads each value before asking for
+        the next key, with value() or elements().
+        """
+
+        self.expect("{")
+        if self.peek() == "}":
+            self.pos += 1
+            return
+        while True:
+            key = self.value()
+            self.expect(":")
+            yield key
+            if self.expect(",}") == "}":
+                return
+
+    def elements(self):
+        """
+        Iterate over the values of an array, decoding them one at a time.
+        """
+
+        self.expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        while True:
+            yield self.value()
+            if self.expect(",]") == "]":
+                return
+
+
+def read_frames(stream: JsonStream):
+    """
+    Yield (grid, fish, sharks) for every frame of a legacy document. Populations are None when
+    the frame does not carry them.
+    """
+
+    for key in stream.items():
+        if key == "history":
+            for grid in stream.elements():
+                yield grid, None, None
+        elif key == "frames":
+            for frame in stream.elements():
+                if isinstance(frame, dict) and "grid" in frame:
+                    yield frame["grid"], frame.get("fish"), frame.get("sharks")
+                else:
+                    yield frame, None, None
+        else:
+            stream.value()
+
+
+def convert(path: str, out_path: str | None = None, keyframe_interval: int = 100) -> tuple[str, int, float]:
+    """
+    Convert a legacy JSON history to a binary recording.
+
+    Args:
+        path (str): The JSON file.
+        out_path (str | None, optional): The recording to write. Defaults to `path` with a
+            .wtr extension.
+        keyframe_interval (int, optional): Number of frames between two full frames.
+
+    Returns:
+        tuple[str, int, float]: Path of the recording, number of frames and conversion time
+            in seconds.
+    """
+
+    if out_path is None:
+        out_path = os.path.splitext(path)[0] + ".wtr"
+
+    start = time.perf_counter()
+    writer = None
+    previous = None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            for chronon, (chars, fish, sharks) in enumerate(read_frames(JsonStream(f))):
+                grid = from_chars(chars)
+                if writer is None:
+                    writer = RecordingWriter(out_path, grid.shape[1], grid.shape[0], keyframe_interval)
+                if fish is None or sharks is None:
+                    fish, sharks = np.count_nonzero(grid == FISH), np.count_nonzero(grid == SHARK)
+                changes = None if previous is None else np.flatnonzero(previous != grid)
+                writer.write_frame(chronon, int(fish), int(sharks), grid, changes)
+                previous = grid
+    finally:
+        if writer is not None:
+            writer.close()
+    if writer is None:
+        raise ValueError(f"No frames found in {path}")
+
+    return out_path, writer.frame_count, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convertit un historique JSON WA-TOR en enregistrement binaire.")
+    parser.add_argument("json_files", nargs="+", help="fichiers wator_history_grid_*.json")
+    parser.add_argument("-o", "--output", help="fichier de sortie (un seul fichier d'entrée)")
+    parser.add_argument("--keyframe-interval", type=int, default=100,
+                        help="nombre de frames entre deux frames complètes (défaut: 100)")
+    args = parser.parse_args()
+    if args.output and len(args.json_files) > 1:
+        parser.error("--output ne peut être utilisé qu'avec un seul fichier")
+
+    for path in args.json_files:
+        out_path, frames, elapsed = convert(path, args.output, args.keyframe_interval)
+        print(f"OK {path}\n → {out_path}")
+        print(f"Frames converties: {frames} en {elapsed:.2f} s ({frames / max(elapsed, 1e-9):.1f} frames/s)")
+
+
+if __name__ == "__main__":
+    main()
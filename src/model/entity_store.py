@@ -0,0 +1,453 @@
+from __future__ import annotations
+import numpy as np
+from .Fish import Fish
+from .Shark import Shark
+from .cells import SHARK
+
+
+class EntityStore:
+    """
+    Struct-of-arrays storage for every animal living on a WatorPlanet.
+
+    Instead of one Python object per animal, positions, timers, energy, liveness and species
+    are kept in contiguous NumPy arrays indexed by an integer entity id. The arrays grow
+    geometrically when full. The rules mirror the ones of the Fish and Shark classes, so
+    the simulation behaves the same whichever representation is used.
+
+    Positions are flat cell indices (x * width + y), so they can be used directly with the
+    planet's neighbor table and with raveled grids.
+
+    The store also keeps a persistent activation order listing every slot once. Newborns are
+    appended to it, dead animals stay in it until the fraction of dead entries crosses
+    `compaction_threshold`; the order is then compacted in place and the freed slots go to
+    a free list reused by later births. In steady state nothing is reallocated per chronon.
+
+    Attributes:
+        width (int): Width of the grid, used to convert flat positions to coordinates.
+        size (int): High-water mark of the slots ever used (alive, dead or free).
+        order (np.ndarray): Activation order; only the first `order_size` entries are meaningful.
+        order_size (int): Number of slots currently listed in the activation order.
+        dead_in_order (int): Number of dead animals still listed in the activation order.
+        compaction_threshold (float): Fraction of dead entries that triggers a compaction.
+        pos (np.ndarray): Flat cell index of each entity.
+        species (np.ndarray): FISH or SHARK code of each entity.
+        alive (np.ndarray): Whether each entity is alive.
+        reproduction_time (np.ndarray): Chronons between two reproductions.
+        time_left (np.ndarray): Remaining chronons before the next reproduction.
+        energy (np.ndarray): Current energy (sharks only).
+        initial_energy (np.ndarray): Energy given back on reset and to newborns (sharks only).
+        starvation_time (np.ndarray): Chronons a shark can survive without eating (sharks only).
+    """
+
+    def __init__(self, width: int, capacity: int = 64, compaction_threshold: float = 0.25):
+        self.width = width
+        self.size = 0
+        self.order_size = 0
+        self.dead_in_order = 0
+        self.free_size = 0
+        self.compaction_threshold = compaction_threshold
+        self._allocate(max(int(capacity), 1))
+
+    def _allocate(self, capacity: int) -> None:
+        self.pos = np.zeros(capacity, dtype=np.int64)
+        self.species = np.zeros(capacity, dtype=np.uint8)
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.reproduction_time = np.zeros(capacity, dtype=np.int32)
+        self.time_left = np.zeros(capacity, dtype=np.int32)
+        self.energy = np.zeros(capacity, dtype=np.int32)
+        self.initial_energy = np.zeros(capacity, dtype=np.int32)
+        self.starvation_time = np.zeros(capacity, dtype=np.int32)
+        self.order = np.zeros(capacity, dtype=np.int64)
+        self.free = np.zeros(capacity, dtype=np.int64)
+
+    def _columns(self) -> tuple[str, ...]:
+        return ("pos", "species", "alive", "reproduction_time", "time_left",
+                "energy", "initial_energy", "starvation_time")
+
+    @property
+    def capacity(self) -> int:
+        return len(self.alive)
+
+    def reserve(self, needed: int) -> None:
+        """
+        Make sure the arrays can hold at least `needed` entities, doubling their size if required.
+
+        Args:
+            needed (int): Minimum number of slots required.
+        """
+
+        if needed <= self.capacity:
+            return
+        capacity = self.capacity
+        while capacity < needed:
+            capacity *= 2
+        used = {"order": self.order_size, "free": self.free_size}
+        for name in self._columns() + ("order", "free"):
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            count = used.get(name, self.size)
+            new[:count] = old[:count]
+            setattr(self, name, new)
+
+    def _take_slots(self, count: int) -> np.ndarray | slice:
+        """
+        Reserve `count` slots, recycling free ones first, and list them in the activation order.
+
+        Args:
+            count (int): Number of slots needed.
+
+        Returns:
+            np.ndarray | slice: The reserved slots.
+        """
+
+        if self.free_size == 0:
+            start = self.size
+            self.reserve(start + count)
+            self.size += count
+            slots = slice(start, start + count)
+            self.order[self.order_size:self.order_size + count] = np.arange(start, start + count)
+        else:
+            recycled = min(count, self.free_size)
+            self.reserve(self.size + count - recycled)
+            self.free_size -= recycled
+            start = self.size
+            self.size += count - recycled
+            slots = np.concatenate([self.free[self.free_size:self.free_size + recycled],
+                                    np.arange(start, self.size)])
+            self.order[self.order_size:self.order_size + count] = slots
+        self.order_size += count
+        return slots
+
+    # ===== CREATION =====
+
+    def add(self, species: int, pos: int, reproduction_time: int,
+            starvation_time: int = 0, energy: int = 0) -> int:
+        """
+        Add a single animal to the store.
+
+        Args:
+            species (int): FISH or SHARK.
+            pos (int): The flat cell index of the animal.
+            reproduction_time (int): Chronons between two reproductions.
+            starvation_time (int, optional): Starvation time (sharks only).
+            energy (int, optional): Initial energy (sharks only).
+
+        Returns:
+            int: The entity id of the new animal.
+        """
+
+        if self.free_size > 0:
+            self.free_size -= 1
+            index = int(self.free[self.free_size])
+        else:
+            index = self.size
+            self.reserve(index + 1)
+            self.size += 1
+        self.order[self.order_size] = index
+        self.order_size += 1
+        self.pos[index] = pos
+        self.species[index] = species
+        self.alive[index] = True
+        self.reproduction_time[index] = reproduction_time
+        self.time_left[index] = reproduction_time
+        self.energy[index] = energy
+        self.initial_energy[index] = energy
+        self.starvation_time[index] = starvation_time
+        return index
+
+    def add_many(self, species: int, positions: np.ndarray, reproduction_time: int,
+                 starvation_time: int = 0, energy: int = 0) -> np.ndarray:
+        """
+        Add a batch of animals of the same species in one vectorized operation.
+
+        Args:
+            species (int): FISH or SHARK.
+            positions (np.ndarray): Flat cell indices of the new animals.
+            reproduction_time (int): Chronons between two reproductions.
+            starvation_time (int, optional): Starvation time (sharks only).
+            energy (int, optional): Initial energy (sharks only).
+
+        Returns:
+            np.ndarray: The entity ids of the new animals.
+        """
+
+        new = self._take_slots(len(positions))
+        self.pos[new] = positions
+        self.species[new] = species
+        self.alive[new] = True
+        self.reproduction_time[new] = reproduction_time
+        self.time_left[new] = reproduction_time
+        self.energy[new] = energy
+        self.initial_energy[new] = energy
+        self.starvation_time[new] = starvation_time
+        if isinstance(new, slice):
+            return np.arange(new.start, new.stop)
+        return new
+
+    # ===== QUERIES =====
+
+    def ids(self, species: int | None = None) -> np.ndarray:
+        """
+        Return the ids of the living animals, optionally restricted to one species.
+
+        Args:
+            species (int | None, optional): FISH, SHARK or None for both.
+
+        Returns:
+            np.ndarray: The ids of the matching living animals.
+        """
+
+        mask = self.alive[:self.size]
+        if species is not None:
+            mask = mask & (self.species[:self.size] == species)
+        return np.flatnonzero(mask)
+
+    def count(self, species: int | None = None) -> int:
+        return len(self.ids(species))
+
+    def get_position(self, index: int) -> tuple[int, int]:
+        return divmod(int(self.pos[index]), self.width)
+
+    def is_alive(self, index: int) -> bool:
+        return bool(self.alive[index])
+
+    def is_shark(self, index: int) -> bool:
+        return self.species[index] == SHARK
+
+    def can_reproduce(self, index: int) -> bool:
+        return self.time_left[index] <= 0
+
+    # ===== RULES =====
+
+    def decrement_time_left(self, index: int) -> None:
+        if self.time_left[index] > 0:
+            self.time_left[index] -= 1
+
+    def decrement_energy(self, index: int) -> None:
+        self.energy[index] -= 1
+        if self.energy[index] <= 0:
+            self.die(index)
+
+    def die(self, index: int) -> None:
+        if self.alive[index]:
+            self.alive[index] = False
+            self.dead_in_order += 1
+
+    def die_many(self, indices: np.ndarray) -> None:
+        """
+        Kill a batch of distinct living animals in one vectorized operation.
+
+        Args:
+            indices (np.ndarray): Entity ids of the animals to kill.
+        """
+
+        self.alive[indices] = False
+        self.dead_in_order += len(indices)
+
+    def reproduce(self, index: int) -> int:
+        """
+        Create an offspring at the parent's position and reset the parent's reproduction timer.
+
+        Args:
+            index (int): The entity id of the parent.
+
+        Returns:
+            int: The entity id of the newborn.
+        """
+
+        baby = self.add(int(self.species[index]), int(self.pos[index]),
+                        int(self.reproduction_time[index]),
+                        int(self.starvation_time[index]),
+                        int(self.initial_energy[index]))
+        self.time_left[index] = self.reproduction_time[index]
+        return baby
+
+    def move_to(self, index: int, new_pos: int) -> bool:
+        """
+        Move an animal, decrementing its reproduction timer and, for sharks, its energy.
+
+        Args:
+            index (int): The entity id of the animal.
+            new_pos (int): The flat index of the destination cell.
+
+        Returns:
+            bool: True if the animal is still alive after the move.
+        """
+
+        self.pos[index] = new_pos
+        self.decrement_time_left(index)
+        if self.species[index] == SHARK:
+            self.decrement_energy(index)
+        return bool(self.alive[index])
+
+    def eat(self, index: int, prey: int, energy_gain: int = 1) -> bool:
+        if not self.alive[prey]:
+            return False
+        self.die(prey)
+        self.energy[index] += energy_gain
+        return True
+
+    # ===== MAINTENANCE =====
+
+    @property
+    def fragmentation(self) -> float:
+        """
+        Fraction of the activation order taken by dead animals.
+        """
+
+        if self.order_size == 0:
+            return 0.0
+        return self.dead_in_order / self.order_size
+
+    def compact(self) -> None:
+        """
+        Remove the dead animals from the activation order and move their slots to the free list.
+
+        Entity ids of the survivors do not change.
+        """
+
+        listed = self.order[:self.order_size]
+        living = self.alive[listed]
+        dead = listed[~living]
+        self.free[self.free_size:self.free_size + len(dead)] = dead
+        self.free_size += len(dead)
+        survivors = listed[living]
+        self.order[:len(survivors)] = survivors
+        self.order_size = len(survivors)
+        self.dead_in_order = 0
+
+    def compact_if_fragmented(self) -> bool:
+        """
+        Compact the activation order only when its fragmentation crosses the threshold.
+
+        Returns:
+            bool: True if a compaction was performed.
+        """
+
+        if self.fragmentation <= self.compaction_threshold:
+            return False
+        self.compact()
+        return True
+
+    # ===== OBJECT VIEWS =====
+
+    def export_arrays(self) -> dict[str, np.ndarray]:
+        """
+        Copy the used part of every array, for checkpoints.
+
+        Returns:
+            dict[str, np.ndarray]: The entity columns, activation order and free list, plus a
+                `counters` array (size, order_size, dead_in_order, free_size).
+        """
+
+        arrays = {name: getattr(self, name)[:self.size].copy() for name in self._columns()}
+        arrays["order"] = self.order[:self.order_size].copy()
+        arrays["free"] = self.free[:self.free_size].copy()
+        arrays["counters"] = np.array([self.size, self.order_size, self.dead_in_order, self.free_size],
+                                      dtype=np.int64)
+        return arrays
+
+    @classmethod
+    def from_arrays(cls, width: int, arrays: dict[str, np.ndarray],
+                    compaction_threshold: float = 0.25) -> EntityStore:
+        """
+        Rebuild a store from the arrays of export_arrays().
+
+        Args:
+            width (int): Width of the grid.
+            arrays (dict[str, np.ndarray]): The exported arrays.
+            compaction_threshold (float): Fraction of dead entries that triggers a compaction.
+
+        Returns:
+            EntityStore: A store in exactly the exported state.
+        """
+
+        size, order_size, dead_in_order, free_size = (int(value) for value in arrays["counters"])
+        store = cls(width, size, compaction_threshold)
+        for name in store._columns():
+            getattr(store, name)[:size] = arrays[name]
+        store.order[:order_size] = arrays["order"]
+        store.free[:free_size] = arrays["free"]
+        store.size, store.order_size, store.dead_in_order, store.free_size = \
+            size, order_size, dead_in_order, free_size
+        return store
+
+    def view(self, index: int) -> Fish:
+        """
+        Return a Fish or Shark object reading and writing this store's arrays.
+
+        Args:
+            index (int): The entity id of the animal.
+
+        Returns:
+            Fish: A FishView or SharkView bound to the entity.
+        """
+
+        if self.species[index] == SHARK:
+            return SharkView(self, int(index))
+        return FishView(self, int(index))
+
+
+def _coordinate_property(axis: int) -> property:
+    def getter(self):
+        return divmod(int(self.store.pos[self.index]), self.store.width)[axis]
+
+    def setter(self, value):
+        coordinates = list(divmod(int(self.store.pos[self.index]), self.store.width))
+        coordinates[axis] = value
+        self.store.pos[self.index] = coordinates[0] * self.store.width + coordinates[1]
+
+    return property(getter, setter)
+
+
+def _column_property(name: str) -> property:
+    def getter(self):
+        return getattr(self.store, name)[self.index].item()
+
+    def setter(self, value):
+        getattr(self.store, name)[self.index] = value
+
+    return property(getter, setter)
+
+
+class FishView(Fish):
+    """
+    A Fish whose attributes live in an EntityStore instead of on the instance.
+
+    Every Fish method works unchanged, reading and writing the store through properties,
+    so legacy code can keep handling Fish objects while the planet stores plain arrays.
+    """
+
+    image = "🐟"
+    positionX = _coordinate_property(0)
+    positionY = _coordinate_property(1)
+    reproduction_time = _column_property("reproduction_time")
+    time_left = _column_property("time_left")
+    alive = _column_property("alive")
+
+    def __init__(self, store: EntityStore, index: int):
+        self.store = store
+        self.index = index
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, FishView) and other.store is self.store and other.index == self.index
+
+    def __hash__(self) -> int:
+        return hash((id(self.store), self.index))
+
+    def reproduce(self) -> Fish:
+        return self.store.view(self.store.reproduce(self.index))
+
+    def die(self) -> None:
+        self.store.die(self.index)
+
+
+class SharkView(FishView, Shark):
+    """
+    A Shark whose attributes live in an EntityStore instead of on the instance.
+    """
+
+    image = "🦈"
+    energy = _column_property("energy")
+    initial_energy = _column_property("initial_energy")
+    starvation_time = _column_property("starvation_time")
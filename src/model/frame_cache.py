@@ -0,0 +1,178 @@
+"""
+Cache of rendered viewer frames, with background prefetch.
+
+Rendered frames are kept in a least-recently-used cache bounded by a memory budget. A worker
+thread renders the frames that follow the playback cursor, so playing, stepping and replaying a
+section mostly hit the cache while Tk stays responsive. The prefetch window is limited to what
+fits in the budget, and frames outside of it are evicted first, so prefetched frames never
+evict each other.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+CACHE_BUDGET = 256 << 20
+PREFETCH_FRAMES = 32
+
+
+class FrameCache:
+    """
+    LRU cache of rendered frames, filled on demand and ahead of the cursor by a worker thread.
+
+    Attributes:
+        render: Function rendering a frame index to a tuple of NumPy arrays, called from both
+            the caller's thread and the worker thread.
+        budget (int): Largest number of bytes of cached arrays.
+        prefetch (int): Number of frames rendered ahead of the cursor.
+        hits (int): Frames found in the cache by get().
+        misses (int): Frames get() had to render itself.
+    """
+
+    def __init__(self, render, budget: int = CACHE_BUDGET, prefetch: int = PREFETCH_FRAMES):
+        self.render = render
+        self.budget = int(budget)
+        self.prefetch = int(prefetch)
+        self.entries = OrderedDict()
+        self.failed = set()
+        self.size = 0
+        self.frame_count = 0
+        self.window = 0
+        self.cursor = 0
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.moved_at = time.perf_counter()
+        self.filled_in = 0.0
+        self.closed = False
+        self.condition = threading.Condition()
+        self.thread = threading.Thread(target=self.run, name="wator-prefetch", daemon=True)
+        self.thread.start()
+
+    def reset(self, frame_count: int, frame_bytes: int) -> None:
+        """
+        Empty the cache for a new history. Call it with a frame count of 0 before replacing the
+        history the frames are rendered from, so that frames rendered meanwhile are discarded.
+
+        Args:
+            frame_count (int): Number of frames of the history.
+            frame_bytes (int): Size of one rendered frame, to fit the prefetch window in the budget.
+        """
+
+        with self.condition:
+            self.generation += 1
+            self.entries.clear()
+            self.failed.clear()
+            self.size = 0
+            self.frame_count = int(frame_count)
+            self.window = max(0, min(self.prefetch, self.budget // max(frame_bytes, 1) - 1,
+                                     self.frame_count - 1))
+            self.cursor = 0
+            self.hits = self.misses = 0
+            self.condition.notify()
+
+    def get(self, index: int):
+        """
+        Return a rendered frame, from the cache or rendered now, and move the prefetch window
+        to the frames that follow it.
+        """
+
+        with self.condition:
+            if index != self.cursor:
+                self.cursor = index
+                self.moved_at = time.perf_counter()
+            entry = self.entries.get(index)
+            if entry is not None:
+                self.entries.move_to_end(index)
+                self.hits += 1
+            else:
+                self.misses += 1
+            generation = self.generation
+            self.condition.notify()
+        if entry is None:
+            entry = self.render(index)
+            self.put(generation, index, entry)
+        return entry
+
+    def wanted(self, index: int) -> bool:
+        """
+        Tell whether a frame is the one at the cursor or in the prefetch window.
+        """
+
+        return (index - self.cursor) % self.frame_count <= self.window
+
+    def put(self, generation: int, index: int, entry) -> None:
+        with self.condition:
+            if generation != self.generation or index in self.entries:
+                return
+            self.entries[index] = entry
+            self.size += sum(array.nbytes for array in entry)
+            while self.size > self.budget and len(self.entries) > 1:
+                victim = next((cached for cached in self.entries if not self.wanted(cached)),
+                              next(iter(self.entries)))
+                self.size -= sum(array.nbytes for array in self.entries.pop(victim))
+
+    def missing(self):
+        """
+        Return the first frame of the prefetch window that is not cached, or None. Frames the
+        worker failed to render are not retried.
+        """
+
+        for offset in range(1, self.window + 1):
+            index = (self.cursor + offset) % self.frame_count
+            if index not in self.entries and index not in self.failed:
+                return index
+        return None
+
+    def run(self) -> None:
+        while True:
+            with self.condition:
+                while not self.closed and (self.frame_count == 0 or self.missing() is None):
+                    self.condition.wait()
+                if self.closed:
+                    return
+                index = self.missing()
+                generation = self.generation
+            try:
+                entry = self.render(index)
+            except Exception:
+                # get() reports the error if the frame is actually shown; the worker skips it.
+                with self.condition:
+                    if generation == self.generation:
+                        self.failed.add(index)
+                continue
+            self.put(generation, index, entry)
+            with self.condition:
+                if generation == self.generation and self.missing() is None:
+                    self.filled_in = time.perf_counter() - self.moved_at
+
+    def stats(self) -> dict:
+        """
+        Return the cache statistics.
+
+        Returns:
+            dict: Hits, misses and hit rate of get(), cached frames and bytes, the prefetch
+                window, how many of its frames are still missing (the prefetch lag, in frames) and
+                the time the worker last took to fill it after the cursor moved.
+        """
+
+        with self.condition:
+            ahead = sum((self.cursor + offset) % self.frame_count in self.entries
+                        for offset in range(1, self.window + 1)) if self.frame_count else 0
+            requests = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / requests if requests else 0.0,
+                "frames": len(self.entries),
+                "bytes": self.size,
+                "window": self.window,
+                "lag": self.window - ahead,
+                "fill_time": self.filled_in,
+            }
+
+    def close(self) -> None:
+        with self.condition:
+            self.closed = True
+            self.condition.notify()
+        self.thread.join()
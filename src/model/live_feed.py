@@ -0,0 +1,119 @@
+"""
+Watch a simulation while it runs.
+
+A worker thread steps a backend (see model.backends) and publishes a copy of every chronon's
+grid into a small bounded queue. The simulation never waits for the viewer: when the queue is
+full the oldest frame is dropped, and the viewer itself only draws the most recent frame each
+time it polls, so a slow display skips frames instead of falling behind the run. Populations
+are kept for every chronon, shown or not.
+"""
+
+import queue
+import threading
+
+import numpy as np
+
+LIVE_QUEUE_SIZE = 4
+
+
+class LiveFeed:
+    """
+    Step a backend in a worker thread and hand its latest frames to the viewer.
+
+    Attributes:
+        world (WatorBackend): The simulation, only used by the worker thread until it stops.
+        chronons (int | None): Chronon at which the run stops, or None to run until stop().
+        produced (int): Frames published by the worker thread.
+        dropped (int): Frames dropped because the queue was full.
+        skipped (int): Frames taken from the queue but not drawn, older than the latest one.
+        chronon_history (list): Chronon of every published frame.
+        fish_history (list): Fish population of every published frame.
+        shark_history (list): Shark population of every published frame.
+    """
+
+    def __init__(self, world, chronons: int | None = None, queue_size: int = LIVE_QUEUE_SIZE):
+        self.world = world
+        self.chronons = None if chronons is None else int(chronons)
+        self.width = world.width
+        self.height = world.height
+        self.queue = queue.Queue(maxsize=max(1, int(queue_size)))
+        self.produced = 0
+        self.dropped = 0
+        self.skipped = 0
+        self.chronon_history = []
+        self.fish_history = []
+        self.shark_history = []
+        self.stopping = threading.Event()
+        self.error = None
+        self.thread = threading.Thread(target=self.run, name="wator-live", daemon=True)
+        self.thread.start()
+
+    @property
+    def finished(self) -> bool:
+        """
+        True once the worker has stopped and every published frame has been taken.
+        """
+
+        return not self.thread.is_alive() and self.queue.empty()
+
+    def publish(self) -> None:
+        world = self.world
+        frame = (world.chronon, world.fish_population, world.shark_population,
+                 np.array(world.grid, dtype=np.uint8))
+        self.chronon_history.append(world.chronon)
+        self.fish_history.append(world.fish_population)
+        self.shark_history.append(world.shark_population)
+        while True:
+            try:
+                self.queue.put_nowait(frame)
+                break
+            except queue.Full:
+                try:
+                    self.queue.get_nowait()
+                    self.dropped += 1
+                except queue.Empty:
+                    pass
+        self.produced += 1
+
+    def run(self) -> None:
+        try:
+            self.publish()
+            while not self.stopping.is_set() and (self.chronons is None or self.world.chronon < self.chronons):
+                self.world.step(1)
+                self.publish()
+        except Exception as error:
+            self.error = error
+        finally:
+            self.world.close()
+
+    def latest(self):
+        """
+        Take every waiting frame and return the most recent one.
+
+        Returns:
+            tuple | None: (chronon, fish, sharks, grid) of the latest frame, or None when no new
+                frame was published since the last call.
+
+        Raises:
+            Exception: The error that stopped the worker thread, if any.
+        """
+
+        if self.error is not None:
+            raise self.error
+        frame = None
+        while True:
+            try:
+                newer = self.queue.get_nowait()
+            except queue.Empty:
+                return frame
+            if frame is not None:
+                self.skipped += 1
+            frame = newer
+
+    def stop(self) -> None:
+        """
+        Stop the simulation after the current chronon and wait for the worker thread.
+        """
+
+        self.stopping.set()
+        self.thread.join()
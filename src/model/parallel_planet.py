@@ -0,0 +1,390 @@
+"""
+Multi-process WA-TOR simulation on a torus split into horizontal strips.
+
+Every worker process owns a strip of rows. The grid and the per-cell animal state
+(reproduction timer, energy and a "moved at chronon" stamp) live in
+multiprocessing.shared_memory blocks that all processes map, so animals crossing a strip
+edge are handed off simply by being written into the boundary row (halo) of the
+neighboring strip.
+
+To make those writes safe without locks, each chronon runs in two phases separated by
+barriers: first every worker updates the top half of its strip, then the bottom half.
+An animal in a top half can only reach its own strip or the last row of the strip above,
+which belongs to that strip's bottom half and is therefore idle in the same phase
+(and symmetrically for bottom halves). The wraparound seam is just another strip edge:
+the first strip hands off into the last row of the grid. Strips need at least 4 rows.
+
+Inside a half strip the update is the synchronous one of vectorized_engine in a single
+round: fish first, then sharks, random neighbor choice, lowest random priority wins a
+contested cell and the losers stay blocked for the chronon.
+Animals stamped with the current chronon (already moved, or newborn) are skipped, so
+nothing moves twice when it crosses from one half or strip into another.
+"""
+
+import multiprocessing as mp
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from .cells import EMPTY, FISH, SHARK, to_chars
+from .planet_class import (WatorPlanet, neighbor_table, FISH_REPRODUCTION_TIME,
+                           SHARK_REPRODUCTION_TIME, SHARK_ENERGY)
+from .vectorized_engine import choose_targets, resolve_conflicts, MASK_WEIGHTS
+
+MIN_STRIP_ROWS = 4
+BATCH_CHRONONS = 1024
+
+FIELDS = {
+    "grid": np.uint8,
+    "time_left": np.int32,
+    "energy": np.int32,
+    "stamp": np.int64,
+}
+
+
+def attach_array(name: str, shape: tuple, dtype) -> tuple[shared_memory.SharedMemory, np.ndarray]:
+    block = shared_memory.SharedMemory(name=name)
+    return block, np.ndarray(shape, dtype=dtype, buffer=block.buf)
+
+
+class Strip:
+    """
+    The view a worker has of the shared torus: flat field arrays, neighbor table and its own
+    random generator. It quacks like a WatorPlanet for vectorized_engine's helpers.
+    """
+
+    def __init__(self, fields: dict, width: int, height: int, rng: np.random.Generator):
+        self.width = width
+        self.height = height
+        self.rng = rng
+        self.neighbors = neighbor_table(height, width)
+        self.cells = fields["grid"].reshape(-1)
+        self.time_left = fields["time_left"].reshape(-1)
+        self.energy = fields["energy"].reshape(-1)
+        self.stamp = fields["stamp"].reshape(-1)
+
+    def pending(self, rows: tuple[int, int], species: int, tick: int) -> np.ndarray:
+        """
+        Return the cells of the given rows holding an animal of `species` that has not moved yet.
+        """
+
+        start, stop = rows[0] * self.width, rows[1] * self.width
+        waiting = (self.cells[start:stop] == species) & (self.stamp[start:stop] != tick)
+        return start + np.flatnonzero(waiting)
+
+    def resolve(self, rows: tuple[int, int], targets: np.ndarray, candidates: np.ndarray) -> np.ndarray:
+        """
+        resolve_conflicts on indices local to the strip and its two halo rows, so the cost of a
+        worker grows with its strip rather than with the grid.
+        """
+
+        size = self.width * self.height
+        local = (targets - (rows[0] - 1) * self.width) % size
+        return resolve_conflicts(self, local, candidates,
+                                 min((rows[1] - rows[0] + 2) * self.width, size))
+
+    def masks(self, cells: np.ndarray, content: int) -> np.ndarray:
+        matches = self.cells[self.neighbors[cells]] == content
+        return matches.view(np.uint8) @ MASK_WEIGHTS
+
+    def move_fishes(self, rows: tuple[int, int], tick: int) -> int:
+        """
+        Move the pending fish of the given rows.
+
+        Returns:
+            int: Number of fish born.
+        """
+
+        cells = self.pending(rows, FISH, tick)
+        masks = self.masks(cells, EMPTY)
+        targets = choose_targets(self, cells, masks)
+        won = self.resolve(rows, targets, masks != 0)
+        sources, targets = cells[won], targets[won]
+
+        time_left = self.time_left[cells]
+        self.time_left[cells] = time_left - (time_left > 0)
+        self.stamp[cells] = tick
+
+        moving_time_left = self.time_left[sources]
+        breeding = time_left[won] <= 0
+        moving_time_left[breeding] = FISH_REPRODUCTION_TIME - 1
+        self.cells[targets] = FISH
+        self.time_left[targets] = moving_time_left
+        self.stamp[targets] = tick
+        self.cells[sources] = np.where(breeding, FISH, EMPTY)
+        self.time_left[sources] = np.where(breeding, FISH_REPRODUCTION_TIME, 0)
+        return int(breeding.sum())
+
+    def move_sharks(self, rows: tuple[int, int], tick: int) -> tuple[int, int]:
+        """
+        Move the pending sharks of the given rows.
+
+        Returns:
+            tuple[int, int]: Number of fish eaten and net change of the shark population.
+        """
+
+        cells = self.pending(rows, SHARK, tick)
+        prey = self.masks(cells, FISH)
+        hunting = prey != 0
+        masks = np.where(hunting, prey, self.masks(cells, EMPTY))
+        targets = choose_targets(self, cells, masks)
+        won = self.resolve(rows, targets, masks != 0)
+        sources, targets, eating = cells[won], targets[won], hunting[won]
+        self.stamp[cells] = tick
+
+        blocked = np.ones(len(cells), dtype=bool)
+        blocked[won] = False
+        stuck = cells[blocked]
+        self.energy[stuck] -= 1
+        dead = stuck[self.energy[stuck] <= 0]
+        self.cells[dead] = EMPTY
+
+        time_left = self.time_left[sources]
+        breeding = time_left <= 0
+        time_left[breeding] = SHARK_REPRODUCTION_TIME
+        time_left -= time_left > 0
+        energy = self.energy[sources] + eating - 1
+        starved = energy <= 0
+        self.cells[targets] = np.where(starved, EMPTY, SHARK)
+        self.time_left[targets] = time_left
+        self.energy[targets] = energy
+        self.stamp[targets] = tick
+        self.cells[sources] = np.where(breeding, SHARK, EMPTY)
+        self.time_left[sources] = np.where(breeding, SHARK_REPRODUCTION_TIME, 0)
+        self.energy[sources] = np.where(breeding, SHARK_ENERGY, 0)
+        return int(eating.sum()), int(breeding.sum() - starved.sum()) - len(dead)
+
+
+def run_worker(names: dict, shape: tuple, rows: tuple[int, int], index: int, seed,
+               control_name: str, deltas_name: str, workers: int,
+               barrier, phase_barrier) -> None:
+    """
+    Worker process loop: wait for a batch of chronons, run them on its strip, report back.
+
+    The population changes of each chronon are written to row `index` of the shared deltas
+    array. A negative batch size in the control array stops the worker.
+    """
+
+    blocks = []
+    fields = {}
+    for field, dtype in FIELDS.items():
+        block, fields[field] = attach_array(names[field], shape, dtype)
+        blocks.append(block)
+    control_block, control = attach_array(control_name, (2,), np.int64)
+    deltas_block, deltas = attach_array(deltas_name, (workers, BATCH_CHRONONS, 2), np.int64)
+    blocks += [control_block, deltas_block]
+
+    strip = Strip(fields, shape[1], shape[0], np.random.default_rng(seed))
+    middle = (rows[0] + rows[1]) // 2
+    halves = ((rows[0], middle), (middle, rows[1]))
+    try:
+        while True:
+            barrier.wait()
+            count, first_tick = int(control[0]), int(control[1])
+            if count < 0:
+                break
+            for step in range(count):
+                tick = first_tick + step
+                fish_delta = shark_delta = 0
+                for half in halves:
+                    fish_delta += strip.move_fishes(half, tick)
+                    eaten, sharks = strip.move_sharks(half, tick)
+                    fish_delta -= eaten
+                    shark_delta += sharks
+                    phase_barrier.wait()
+                deltas[index, step] = (fish_delta, shark_delta)
+            barrier.wait()
+    except Exception:
+        barrier.abort()
+        phase_barrier.abort()
+        raise
+    finally:
+        del fields, control, deltas, strip
+        for block in blocks:
+            block.close()
+
+
+class ParallelWatorPlanet:
+    """
+    A WA-TOR world stepped by several worker processes over shared memory.
+
+    The initial state is drawn exactly like a WatorPlanet with the same parameters and seed.
+    Worker processes are started on creation and stay alive between calls; call close()
+    (or use the instance as a context manager) to stop them and free the shared memory.
+
+    Attributes:
+        width (int): Width of the simulation grid.
+        height (int): Height of the simulation grid.
+        perc_fish (float): Percentage of the grid initially populated with fish.
+        perc_shark (float): Percentage of the grid initially populated with sharks.
+        workers (int): Number of worker processes (one strip of rows each).
+        chronon (int): Current time step (chronon) of the simulation.
+        fish_population (int): Current number of fish in the simulation.
+        shark_population (int): Current number of sharks in the simulation.
+        fish_history (list): Historical record of fish population counts over time.
+        shark_history (list): Historical record of shark population counts over time.
+        grid (np.ndarray): The shared uint8 grid (EMPTY, FISH or SHARK per cell).
+    """
+
+    def __init__(self,
+                 width: int,
+                 height: int,
+                 perc_fish: float,
+                 perc_shark: float,
+                 rng: np.random.Generator | int | None = None,
+                 workers: int | None = None):
+        self.width = width
+        self.height = height
+        self.perc_fish = perc_fish
+        self.perc_shark = perc_shark
+
+        if workers is None:
+            workers = mp.cpu_count()
+        self.workers = max(1, min(int(workers), height // MIN_STRIP_ROWS))
+
+        seed_sequence = np.random.SeedSequence(rng if isinstance(rng, int) or rng is None
+                                               else rng.integers(2**63))
+        planet_seed, *worker_seeds = seed_sequence.spawn(self.workers + 1)
+        planet = WatorPlanet(width, height, perc_fish, perc_shark, rng=np.random.default_rng(planet_seed))
+
+        self._blocks = []
+        self._fields = {}
+        for field, dtype in FIELDS.items():
+            self._fields[field] = self._allocate((height, width), dtype)
+        self.grid = self._fields["grid"]
+        self.grid[:] = planet.grid
+        store = planet.store
+        alive = store.ids()
+        self._fields["time_left"].reshape(-1)[store.pos[alive]] = store.time_left[alive]
+        self._fields["energy"].reshape(-1)[store.pos[alive]] = store.energy[alive]
+        self._fields["stamp"][:] = 0
+        self._control = self._allocate((2,), np.int64)
+        self._deltas = self._allocate((self.workers, BATCH_CHRONONS, 2), np.int64)
+
+        self.chronon = 0
+        self._changes_since = 0
+        self.fish_population = planet.fish_population
+        self.shark_population = planet.shark_population
+        self.fish_history = [self.fish_population]
+        self.shark_history = [self.shark_population]
+
+        bounds = np.linspace(0, height, self.workers + 1).astype(int)
+        context = mp.get_context()
+        self._barrier = context.Barrier(self.workers + 1)
+        phase_barrier = context.Barrier(self.workers)
+        names = {field: block.name for field, block in zip(FIELDS, self._blocks)}
+        self._processes = []
+        for index in range(self.workers):
+            process = context.Process(
+                target=run_worker,
+                args=(names, (height, width), (int(bounds[index]), int(bounds[index + 1])), index,
+                      worker_seeds[index], self._blocks[-2].name, self._blocks[-1].name,
+                      self.workers, self._barrier, phase_barrier),
+                daemon=True)
+            process.start()
+            self._processes.append(process)
+
+    def _allocate(self, shape: tuple, dtype) -> np.ndarray:
+        size = int(np.prod(shape)) * np.dtype(dtype).itemsize
+        block = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        self._blocks.append(block)
+        return np.ndarray(shape, dtype=dtype, buffer=block.buf)
+
+    def step(self, count: int = 1) -> None:
+        """
+        Run `count` chronons on the worker processes and update populations and histories.
+
+        Args:
+            count (int, optional): Number of chronons to run. Defaults to 1.
+        """
+
+        remaining = int(count)
+        while remaining > 0:
+            batch = min(remaining, BATCH_CHRONONS)
+            self._control[:] = (batch, self.chronon + 1)
+            self._barrier.wait()
+            self._barrier.wait()
+            for fish_delta, shark_delta in self._deltas[:, :batch].sum(axis=0).tolist():
+                self.fish_population += fish_delta
+                self.shark_population += shark_delta
+                self.fish_history.append(self.fish_population)
+                self.shark_history.append(self.shark_population)
+            self.chronon += batch
+            remaining -= batch
+
+    def movement_result(self) -> None:
+        """
+        Execute a single chronon (time step) of the simulation.
+        """
+
+        self.step(1)
+
+    def take_changes(self) -> np.ndarray:
+        """
+        Return the cells touched since the previous call, from the workers' move stamps.
+
+        Returns:
+            np.ndarray: Sorted flat indices of the cells that may have changed. Cells whose
+                content ended up unchanged can appear; cells that changed are never missing.
+        """
+
+        changes = np.flatnonzero(self._fields["stamp"].reshape(-1) > self._changes_since)
+        self._changes_since = self.chronon
+        return changes
+
+    def export_state(self) -> dict:
+        """
+        Export the state of the world as plain per-cell arrays.
+
+        Returns:
+            dict: The chronon, the populations, and copies of the grid and of the reproduction
+                timer and energy of the animal in each cell (0 on empty cells).
+        """
+
+        occupied = self.grid != EMPTY
+        return {
+            "chronon": self.chronon,
+            "fish_population": self.fish_population,
+            "shark_population": self.shark_population,
+            "grid": self.grid.copy(),
+            "time_left": np.where(occupied, self._fields["time_left"], 0).astype(np.int32),
+            "energy": np.where(self.grid == SHARK, self._fields["energy"], 0).astype(np.int32),
+        }
+
+    def render(self) -> np.ndarray:
+        """
+        Return the grid as one-character cells (" ", "F", "S") for printing and export.
+        """
+
+        return to_chars(self.grid)
+
+    def close(self) -> None:
+        """
+        Stop the worker processes and release the shared memory.
+        """
+
+        if not self._processes:
+            return
+        self._control[:] = (-1, 0)
+        try:
+            self._barrier.wait(timeout=5)
+        except Exception:
+            pass
+        for process in self._processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+        self._processes = []
+        self.grid = self.grid.copy()
+        self._fields = {}
+        self._control = self._deltas = None
+        for block in self._blocks:
+            block.close()
+            block.unlink()
+        self._blocks = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -1,7 +1,45 @@
 import numpy as np
 import json
+from functools import lru_cache
 from .Fish import Fish
 from .Shark import Shark
+from .cells import EMPTY, FISH, SHARK, to_chars
+from .entity_store import EntityStore
+from .vectorized_engine import vectorized_step
+from .sublattice_engine import sublattice_step
+
+ENGINES = ("sequential", "vectorized", "sublattice")
+
+FISH_REPRODUCTION_TIME = 2
+SHARK_REPRODUCTION_TIME = 6
+SHARK_STARVATION_TIME = 5
+SHARK_ENERGY = 2
+
+
+@lru_cache(maxsize=None)
+def neighbor_table(height: int, width: int) -> np.ndarray:
+    """
+    Build the toroidal neighbor table of a grid, once per grid size.
+
+    Row `cell` of the table holds the flat indices of the four orthogonal neighbors
+    (up, down, left, right) of the flat cell index `cell`, with edges wrapping around.
+    The table is cached and read-only, so every WatorPlanet of the same size shares it.
+
+    Args:
+        height (int): Height of the grid.
+        width (int): Width of the grid.
+
+    Returns:
+        np.ndarray: An array of shape (height * width, 4) of flat cell indices.
+    """
+
+    rows, columns = np.divmod(np.arange(height * width), width)
+    directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+    table = np.empty((height * width, len(directions)), dtype=np.int32)
+    for k, (delta_x, delta_y) in enumerate(directions):
+        table[:, k] = ((rows + delta_x) % height) * width + (columns + delta_y) % width
+    table.setflags(write=False)
+    return table
 
 class WatorPlanet:
     """
@@ -18,26 +56,45 @@ class WatorPlanet:
         perc_shark (float): Percentage of the grid initially populated with sharks.
         empty_spaces (int): Number of empty spaces in the grid after initial population.
         chronon (int): Current time step (chronon) of the simulation.
-        fishes (list): List of fish entities in the simulation.
-        sharks (list): List of shark entities in the simulation.
+        store (EntityStore): Struct-of-arrays storage of every animal, indexed by entity id.
+        fishes (list): Fish views of the living fish (read from the store).
+        sharks (list): Shark views of the living sharks (read from the store).
         fish_population (int): Current number of fish in the simulation.
         shark_population (int): Current number of sharks in the simulation.
         fish_history (list): Historical record of fish population counts over time.
         shark_history (list): Historical record of shark population counts over time.
-        grid (2D list): The grid representing the simulation world.
+        grid (np.ndarray): The uint8 grid of the simulation world (EMPTY, FISH or SHARK per cell).
+        occupancy (np.ndarray): Entity id of the animal in each cell of the grid, -1 when empty.
+        neighbors (np.ndarray): Shared (height * width, 4) table of the flat indices of each cell's neighbors.
+        rng (np.random.Generator): Random generator driving the whole simulation, built from the
+            `rng` argument (a Generator, a seed for reproducible runs, or None).
+        engine (str): "sequential" (default) moves animals one at a time in a shuffled order;
+            "vectorized" updates all fish then all sharks with whole-array operations
+            (close to the sequential dynamics, not step-identical, see vectorized_engine);
+            "sublattice" updates whole colors of mutually independent cells at once, in a
+            shuffled order of colors (see sublattice_engine).
+
+    Cells are addressed by their flat index `x * width + y` inside the simulation loop.
+    Use render() to get the legacy " "/"F"/"S" view of the grid.
     """
 
     def __init__(self,
                  width: int,
                  height: int,
                  perc_fish: float,
-                 perc_shark: float):
+                 perc_shark: float,
+                 rng: np.random.Generator | int | None = None,
+                 engine: str = "sequential"):
         
         self.width = width
         self.height = height
         self.perc_fish = perc_fish
         self.perc_shark = perc_shark
         
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown engine {engine!r}, expected one of {ENGINES}")
+        self.engine = engine
+        
         world_spaces = height * width
         initial_fish_count = int(perc_fish * world_spaces)
         initial_shark_count = int(perc_shark * world_spaces)
@@ -45,8 +102,15 @@ class WatorPlanet:
         
         self.chronon = 0
         
-        self.fishes = []
-        self.sharks = []
+        self.rng = np.random.default_rng(rng)
+        self._draws = np.empty(0)
+        self._draw_count = 0
+        self._draw_cursor = 0
+        
+        self.store = EntityStore(width, initial_fish_count + initial_shark_count)
+        self.neighbors = neighbor_table(height, width)
+        self._neighbor_matches = np.empty(self.neighbors.shape[1], dtype=self.neighbors.dtype)
+        self._touched = np.zeros(width * height, dtype=bool)
         
         self.fish_population = initial_fish_count
         self.shark_population = initial_shark_count
@@ -58,132 +122,188 @@ class WatorPlanet:
     
     def create_grid(self):
         array = np.concatenate([
-            np.full(self.fish_population, "F"),
-            np.full(self.shark_population, "S"),
-            np.full(self.empty_spaces, " ")
+            np.full(self.fish_population, FISH, dtype=np.uint8),
+            np.full(self.shark_population, SHARK, dtype=np.uint8),
+            np.full(self.empty_spaces, EMPTY, dtype=np.uint8)
         ])
         
-        np.random.shuffle(array)
+        self.rng.shuffle(array)
         self.grid = array.reshape(self.height, self.width)
+        self.cells = self.grid.reshape(-1)
         
         self.initialize_population()
     
     def initialize_population(self):
-        fish_positions = np.argwhere(self.grid == "F")
-        for position in fish_positions:
-            x, y = position
-            fish = Fish("🐟", int(x), int(y), reproduction_time=2)
-            self.fishes.append(fish)
+        self.occupancy = np.full((self.height, self.width), -1, dtype=np.int64)
+        self.occupants = self.occupancy.reshape(-1)
+        
+        fish_positions = np.flatnonzero(self.cells == FISH)
+        self.occupants[fish_positions] = self.store.add_many(FISH, fish_positions,
+                                                             reproduction_time=FISH_REPRODUCTION_TIME)
         
-        shark_positions = np.argwhere(self.grid == "S")
-        for position in shark_positions:
-            x, y = position
-            shark = Shark("🦈", int(x), int(y), reproduction_time=6, starvation_time=5, energy=2)
-            self.sharks.append(shark)
+        shark_positions = np.flatnonzero(self.cells == SHARK)
+        self.occupants[shark_positions] = self.store.add_many(SHARK, shark_positions,
+                                                              reproduction_time=SHARK_REPRODUCTION_TIME,
+                                                              starvation_time=SHARK_STARVATION_TIME,
+                                                              energy=SHARK_ENERGY)
+    
+    @property
+    def fishes(self) -> list[Fish]:
+        """
+        Fish views of the living fish, for code that still works with Fish objects.
+        """
+
+        return [self.store.view(index) for index in self.store.ids(FISH)]
+    
+    @property
+    def sharks(self) -> list[Shark]:
+        """
+        Shark views of the living sharks, for code that still works with Shark objects.
+        """
+
+        return [self.store.view(index) for index in self.store.ids(SHARK)]
     
-    def get_all_neighbors(self, x: int, y: int) -> list[tuple[int, int]]:
+    def render(self) -> np.ndarray:
         """
-        Retrieve the coordinates of all valid neighboring cells around a given position on the grid.
+        Return the grid as one-character cells (" ", "F", "S") for printing and export.
+        """
+
+        return to_chars(self.grid)
+    
+    def get_all_neighbors(self, cell: int) -> np.ndarray:
+        """
+        Retrieve the flat indices of all neighboring cells around a given cell on the grid.
 
-        This method calculates the four orthogonal neighbors (up, down, left, right) of the cell
-        at coordinates (x, y), using toroidal (wrapping) boundary conditions. The grid is treated
-        as a torus, meaning edges wrap around to the opposite side.
+        The four orthogonal neighbors (up, down, left, right) come from the precomputed
+        toroidal neighbor table, so edges wrap around to the opposite side and nothing
+        is computed per call.
 
         Args:
-            x (int): The x-coordinate of the cell.
-            y (int): The y-coordinate of the cell.
+            cell (int): The flat index of the cell.
 
         Returns:
-            list[tuple[int, int]]: A list of tuples representing the (x, y) coordinates of neighboring cells.
+            np.ndarray: The flat indices of the neighboring cells.
         """
 
-        neighbors = []
-        directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]
-        for delta_x, delta_y in directions:
-            nx = (x + delta_x) % self.height
-            ny = (y + delta_y) % self.width
-            neighbors.append((nx, ny))
-        return neighbors
+        return self.neighbors[cell]
     
-    def filter_neighbors(self, neighbors: list[tuple[int, int]], content: str) -> list[tuple[int, int]]:
+    def filter_neighbors(self, neighbors: np.ndarray, content: int) -> np.ndarray:
         """
-        Filter a list of neighboring coordinates to only include those matching a specific content.
+        Filter an array of neighboring cells to only include those matching a specific content.
+
+        The matches are written into a preallocated buffer, so nothing is allocated per animal;
+        the returned view is only valid until the next call.
 
         Args:
-            neighbors (list[tuple[int, int]]): List of (x, y) coordinates of neighboring cells.
-            content (str): The content to match in the grid (e.g., " ", "F", "S").
+            neighbors (np.ndarray): Flat indices of neighboring cells.
+            content (int): The cell code to match in the grid (EMPTY, FISH or SHARK).
 
         Returns:
-            list[tuple[int, int]]: A filtered list of coordinates where the grid content matches the specified value.
+            np.ndarray: The flat indices of the cells whose grid content matches the specified value.
         """
 
-        return [(nx, ny) for nx, ny in neighbors if self.grid[nx, ny] == content]
+        cells = self.cells
+        matches = self._neighbor_matches
+        count = 0
+        for neighbor in neighbors.tolist():
+            if cells[neighbor] == content:
+                matches[count] = neighbor
+                count += 1
+        return matches[:count]
     
-    def get_empty_neighbors(self, x: int, y: int) -> list[tuple[int, int]]:
+    def get_empty_neighbors(self, cell: int) -> np.ndarray:
         """
-        Retrieve the coordinates of all empty neighboring cells around a given position.
+        Retrieve the flat indices of all empty neighboring cells around a given cell.
 
         Args:
-            x (int): The x-coordinate of the cell.
-            y (int): The y-coordinate of the cell.
+            cell (int): The flat index of the cell.
 
         Returns:
-            list[tuple[int, int]]: A list of (x, y) coordinates of empty neighboring cells.
+            np.ndarray: The flat indices of empty neighboring cells.
         """
 
-        neighbors = self.get_all_neighbors(x, y)
-        return self.filter_neighbors(neighbors, " ")
+        return self.filter_neighbors(self.neighbors[cell], EMPTY)
     
-    def get_fish_neighbors(self, x: int, y: int) -> list[tuple[int, int]]:
+    def get_fish_neighbors(self, cell: int) -> np.ndarray:
         """
-        Retrieve the coordinates of all neighboring cells containing fish around a given position.
+        Retrieve the flat indices of all neighboring cells containing fish around a given cell.
 
         Args:
-            x (int): The x-coordinate of the cell.
-            y (int): The y-coordinate of the cell.
+            cell (int): The flat index of the cell.
 
         Returns:
-            list[tuple[int, int]]: A list of (x, y) coordinates of neighboring cells containing fish.
+            np.ndarray: The flat indices of neighboring cells containing fish.
         """
 
-        neighbors = self.get_all_neighbors(x, y)
-        return self.filter_neighbors(neighbors, "F")
+        return self.filter_neighbors(self.neighbors[cell], FISH)
     
-    def choose_random_neighbor(self, neighbors: list[tuple[int, int]]) -> tuple[int, int] | None:
+    def draw_random(self) -> float:
         """
-        Randomly select a neighbor from a list of coordinates.
+        Return the next uniform number in [0, 1) from the current batch of random draws.
+
+        The batch is normally drawn once per chronon by movement_result; it is refilled
+        here only when exhausted (e.g. when moves are triggered outside a chronon).
+
+        Returns:
+            float: A uniform random number in [0, 1).
+        """
+
+        if self._draw_cursor >= self._draw_count:
+            self.draw_batch(max(self.store.order_size, 64))
+        value = self._draws[self._draw_cursor]
+        self._draw_cursor += 1
+        return value
+    
+    def draw_batch(self, count: int) -> None:
+        """
+        Fill the reusable random buffer with `count` new uniform numbers in one call.
+
+        Args:
+            count (int): Number of random numbers needed.
+        """
+
+        if len(self._draws) < count:
+            self._draws = np.empty(max(count, 2 * len(self._draws)))
+        self.rng.random(out=self._draws[:count])
+        self._draw_count = count
+        self._draw_cursor = 0
+    
+    def choose_random_neighbor(self, neighbors: np.ndarray) -> int | None:
+        """
+        Randomly select a neighbor from an array of cells.
 
         Args:
-            neighbors (list[tuple[int, int]]): List of (x, y) coordinates to choose from.
+            neighbors (np.ndarray): Flat indices of the cells to choose from.
 
         Returns:
-            tuple[int, int] | None: A randomly selected coordinate, or None if the list is empty.
+            int | None: A randomly selected flat index, or None if the array is empty.
         """
 
         if len(neighbors) == 0:
             return None
-        return neighbors[np.random.randint(len(neighbors))]
+        return int(neighbors[int(self.draw_random() * len(neighbors))])
     
-    def find_fish(self, x: int, y: int) -> Fish | None:
+    def find_fish(self, cell: int) -> int | None:
         """
         Find a fish entity at a specific grid position.
 
+        The lookup goes through the occupancy index, so it runs in constant time.
+
         Args:
-            x (int): The x-coordinate of the cell.
-            y (int): The y-coordinate of the cell.
+            cell (int): The flat index of the cell.
 
         Returns:
-            Fish | None: The fish at the specified position, or None if no fish is found or alive.
+            int | None: The entity id of the fish at the specified position, or None if no fish is found or alive.
         """
 
-        for fish in self.fishes:
-            if fish.isAlive() and fish.getX() == x and fish.getY() == y:
-                return fish
-        return None
+        index = int(self.occupants[cell])
+        if index < 0 or self.store.species[index] != FISH or not self.store.alive[index]:
+            return None
+        return index
     
     
     
-    def move_fish(self, fish: Fish) -> None:
+    def move_fish(self, fish: int) -> None:
         """
         Move a fish to a random empty neighboring cell or attempt reproduction if possible.
 
@@ -191,182 +311,276 @@ class WatorPlanet:
         If the fish can reproduce, a new fish is created and added to the simulation.
 
         Args:
-            fish (Fish): The fish entity to move.
+            fish (int): The entity id of the fish to move.
         """
 
-        if not fish.isAlive():
+        store = self.store
+        if not store.is_alive(fish):
             return
         
-        x, y = fish.getPosition()
-        empty_neighbors = self.get_empty_neighbors(x, y)
+        cell = int(store.pos[fish])
+        empty_neighbors = self.get_empty_neighbors(cell)
         
-        if not empty_neighbors:
-            fish.decrementTimeLeft()
+        if len(empty_neighbors) == 0:
+            store.decrement_time_left(fish)
             return
-        new_x, new_y = self.choose_random_neighbor(empty_neighbors)
+        new_cell = self.choose_random_neighbor(empty_neighbors)
         
-        if fish.canReproduce():
-            baby = fish.reproduce()
-            self.fishes.append(baby)
-            self.grid[x, y] = "F"
+        if store.can_reproduce(fish):
+            self.occupants[cell] = store.reproduce(fish)
+            self.cells[cell] = FISH
             self.fish_population += 1
         else:
-            self.grid[x, y] = " "
+            self.occupants[cell] = -1
+            self.cells[cell] = EMPTY
     
-        fish.moveTo(new_x, new_y)
-        self.grid[new_x, new_y] = "F"
+        store.move_to(fish, new_cell)
+        self.occupants[new_cell] = fish
+        self.cells[new_cell] = FISH
+        self._touched[cell] = self._touched[new_cell] = True
     
     
-    def move_shark(self, shark: Shark) -> None:
+    def move_shark(self, shark: int) -> None:
         """
         Move a shark according to its behavior: eating, moving, or losing energy if blocked.
 
         Args:
-            shark (Shark): The shark entity to move.
+            shark (int): The entity id of the shark to move.
         """
 
-        if not shark.isAlive():
+        if not self.store.is_alive(shark):
             return
         
-        x, y = shark.getPosition()
+        cell = int(self.store.pos[shark])
         
-        if self.shark_tries_to_eat(shark, x, y):
+        if self.shark_tries_to_eat(shark, cell):
             return
         
-        if self.shark_tries_to_move(shark, x, y):
+        if self.shark_tries_to_move(shark, cell):
             return
         
-        self.shark_blocked(shark, x, y)
+        self.shark_blocked(shark, cell)
 
-    def shark_tries_to_eat(self, shark, x, y) -> bool:
+    def shark_tries_to_eat(self, shark, cell) -> bool:
         """
         Attempt for a shark to eat a fish in a neighboring cell.
 
         If successful, the shark's energy is reset, the fish is removed, and the shark moves to the fish's position.
 
         Args:
-            shark (Shark): The shark attempting to eat.
-            x (int): The x-coordinate of the shark.
-            y (int): The y-coordinate of the shark.
+            shark (int): The entity id of the shark attempting to eat.
+            cell (int): The flat index of the shark's cell.
 
         Returns:
             bool: True if the shark successfully ate a fish, False otherwise.
         """
 
-        fish_neighbors = self.get_fish_neighbors(x, y)
+        fish_neighbors = self.get_fish_neighbors(cell)
         
-        if not fish_neighbors:
+        if len(fish_neighbors) == 0:
             return False
         
-        target_x, target_y = self.choose_random_neighbor(fish_neighbors)
-        target_fish = self.find_fish(target_x, target_y)
+        target_cell = self.choose_random_neighbor(fish_neighbors)
+        target_fish = self.find_fish(target_cell)
         
-        if not target_fish or not target_fish.isAlive():
+        if target_fish is None or not self.store.is_alive(target_fish):
             return False
         
-        shark.eat(target_fish)
+        self.store.eat(shark, target_fish)
         self.fish_population -= 1
         
-        self.complete_shark_move(shark, x, y, target_x, target_y)
+        self.complete_shark_move(shark, cell, target_cell)
         return True
 
-    def shark_tries_to_move(self, shark, x, y) -> bool:
+    def shark_tries_to_move(self, shark, cell) -> bool:
         """
         Attempt for a shark to move to an empty neighboring cell.
 
         If successful, the shark moves to the new position.
 
         Args:
-            shark (Shark): The shark attempting to move.
-            x (int): The x-coordinate of the shark.
-            y (int): The y-coordinate of the shark.
+            shark (int): The entity id of the shark attempting to move.
+            cell (int): The flat index of the shark's cell.
 
         Returns:
             bool: True if the shark successfully moved, False otherwise.
         """
 
-        empty_neighbors = self.get_empty_neighbors(x, y)
+        empty_neighbors = self.get_empty_neighbors(cell)
         
-        if not empty_neighbors:
+        if len(empty_neighbors) == 0:
             return False
         
-        new_x, new_y = self.choose_random_neighbor(empty_neighbors)
-        self.complete_shark_move(shark, x, y, new_x, new_y)
+        new_cell = self.choose_random_neighbor(empty_neighbors)
+        self.complete_shark_move(shark, cell, new_cell)
         return True
 
-    def shark_blocked(self, shark, x, y) -> None:
+    def shark_blocked(self, shark, cell) -> None:
         """
         Handle the case where a shark cannot move or eat.
 
         The shark loses energy and dies if its energy reaches zero.
 
         Args:
-            shark (Shark): The shark that is blocked.
-            x (int): The x-coordinate of the shark.
-            y (int): The y-coordinate of the shark.
+            shark (int): The entity id of the shark that is blocked.
+            cell (int): The flat index of the shark's cell.
         """
 
-        shark.decrementEnergy()
-        if not shark.isAlive():
-            self.grid[x, y] = " "
+        self.store.decrement_energy(shark)
+        if not self.store.is_alive(shark):
+            self.occupants[cell] = -1
+            self.cells[cell] = EMPTY
             self.shark_population -= 1
+            self._touched[cell] = True
 
-    def complete_shark_move(self, shark, x, y, new_x, new_y) -> None:
+    def complete_shark_move(self, shark, cell, new_cell) -> None:
         """
         Complete the movement of a shark after eating or moving.
 
         Handles reproduction if possible, updates the grid, and checks if the shark is still alive.
 
         Args:
-            shark (Shark): The shark that moved.
-            x (int): The original x-coordinate of the shark.
-            y (int): The original y-coordinate of the shark.
-            new_x (int): The new x-coordinate of the shark.
-            new_y (int): The new y-coordinate of the shark.
+            shark (int): The entity id of the shark that moved.
+            cell (int): The flat index of the shark's original cell.
+            new_cell (int): The flat index of the shark's new cell.
         """
 
-        if shark.canReproduce():
-            baby = shark.reproduce()
-            self.sharks.append(baby)
-            self.grid[x, y] = "S"
+        store = self.store
+        if store.can_reproduce(shark):
+            self.occupants[cell] = store.reproduce(shark)
+            self.cells[cell] = SHARK
             self.shark_population += 1
         else:
-            self.grid[x, y] = " "
+            self.occupants[cell] = -1
+            self.cells[cell] = EMPTY
         
-        shark.moveTo(new_x, new_y)
+        store.move_to(shark, new_cell)
         
-        if not shark.isAlive():
-            self.grid[new_x, new_y] = " "
+        if not store.is_alive(shark):
+            self.occupants[new_cell] = -1
+            self.cells[new_cell] = EMPTY
             self.shark_population -= 1
         else:
-            self.grid[new_x, new_y] = "S"
+            self.occupants[new_cell] = shark
+            self.cells[new_cell] = SHARK
+        self._touched[cell] = self._touched[new_cell] = True
                         
     def movement_result(self) -> None:
         """
         Execute a single chronon (time step) of the simulation.
 
-        Shuffles the order of animals, moves each fish and shark, updates populations,
-        and increments the chronon counter. Dead animals are removed from the simulation.
+        Moves each fish and shark with the selected engine, updates populations,
+        and increments the chronon counter.
         """
 
-        all_animals = self.fishes + self.sharks
-        np.random.shuffle(all_animals)
+        if self.engine == "vectorized":
+            vectorized_step(self)
+        elif self.engine == "sublattice":
+            sublattice_step(self)
+        else:
+            self.sequential_step()
+
+        self.chronon += 1
+        self.fish_history.append(self.fish_population)
+        self.shark_history.append(self.shark_population)
+
+    def record_changes(self, *cells: np.ndarray) -> None:
+        """
+        Remember cells whose content may have changed, for take_changes().
+
+        Engines call this with the cells their moves, births and deaths touched. They are marked
+        in a grid-sized mask, so recording costs the same whether or not anybody takes them.
+
+        Args:
+            *cells (np.ndarray): Arrays of flat cell indices.
+        """
+
+        for array in cells:
+            self._touched[array] = True
+
+    def take_changes(self) -> np.ndarray:
+        """
+        Return the cells touched since the previous call and forget them.
+
+        Returns:
+            np.ndarray: Sorted flat indices of the cells that may have changed. Cells whose
+                content ended up unchanged can appear; cells that changed are never missing.
+        """
+
+        changes = np.flatnonzero(self._touched)
+        self._touched[changes] = False
+        return changes
+
+    def step(self, count: int = 1) -> None:
+        """
+        Run `count` chronons of the simulation.
+
+        Args:
+            count (int, optional): Number of chronons to run. Defaults to 1.
+        """
+
+        for _ in range(int(count)):
+            self.movement_result()
+
+    def export_state(self) -> dict:
+        """
+        Export the state of the world as plain per-cell arrays.
+
+        Returns:
+            dict: The chronon, the populations, and copies of the grid and of the reproduction
+                timer and energy of the animal in each cell (0 on empty cells).
+        """
+
+        alive = self.store.ids()
+        cells = self.store.pos[alive]
+        time_left = np.zeros(self.grid.shape, dtype=np.int32)
+        energy = np.zeros(self.grid.shape, dtype=np.int32)
+        time_left.reshape(-1)[cells] = self.store.time_left[alive]
+        energy.reshape(-1)[cells] = self.store.energy[alive]
+        return {
+            "chronon": self.chronon,
+            "fish_population": self.fish_population,
+            "shark_population": self.shark_population,
+            "grid": self.grid.copy(),
+            "time_left": time_left,
+            "energy": energy,
+        }
+
+    def close(self) -> None:
+        """
+        Release the resources of the world. Nothing to do for an in-process planet.
+        """
+
+    def sequential_step(self) -> None:
+        """
+        Move every animal one at a time, in a shuffled order.
+
+        Animals born during the chronon only start moving at the next one.
+        Every animal makes at most one random choice, so the random numbers of the whole
+        chronon are drawn in a single batch.
+
+        The activation order is shuffled in place and reused from one chronon to the next;
+        dead animals are skipped and only dropped from it when the store's fragmentation
+        threshold is crossed, so a chronon allocates no per-animal arrays. The moves mark
+        the cells they touch for take_changes() as they go.
+        """
+
+        store = self.store
+        count = store.order_size
+        self.rng.shuffle(store.order[:count])
+        self.draw_batch(count)
         
-        for animal in all_animals:
-            if not animal.isAlive():
+        for i in range(count):
+            animal = int(store.order[i])
+            if not store.alive[animal]:
                 continue
             
-            if isinstance(animal, Shark):
+            if store.species[animal] == SHARK:
                 self.move_shark(animal)
-            elif isinstance(animal, Fish):
+            else:
                 self.move_fish(animal)
                 
-        self.fishes = [fish for fish in self.fishes if fish.isAlive()]
-        self.sharks = [shark for shark in self.sharks if shark.isAlive()]
-
-        self.chronon += 1
-        self.fish_history.append(self.fish_population)
-        self.shark_history.append(self.shark_population)
+        store.compact_if_fragmented()
 
 def simulation(num_chronons: int):
     world = WatorPlanet(
@@ -380,7 +594,7 @@ def simulation(num_chronons: int):
     print("WA-TOR SIMULATION")
     print("=" * 50)
     print("Initial grid:")
-    print(world.grid)
+    print(world.render())
     print(f"Fish: {world.fish_population} | Sharks: {world.shark_population}")
     print(f"Chronon: {world.chronon}\n")
     
@@ -389,7 +603,7 @@ def simulation(num_chronons: int):
         
         print("=" * 50)
         print(f"Chronon {world.chronon}:")
-        print(world.grid)
+        print(world.render())
         print(f"Fish: {world.fish_population} | Sharks: {world.shark_population}")
     print("\nSimulation complete!")
     return world
@@ -0,0 +1,139 @@
+import contextlib
+import json
+import os
+from datetime import datetime
+from .backends import create_backend
+from .recorder_json import OUTPUT_DIR
+from .background_writer import BackgroundWriter
+from .checkpoint import load_checkpoint, save_checkpoint
+from .chunked_recording import ChunkedRecordingWriter, CHUNK_FRAMES
+from .sampling import make_sampling
+from .recording import RecordingWriter
+
+KEYFRAME_INTERVAL = 100
+
+
+def run_and_record_binary(width, height, chronons, perc_fish=0.5, perc_shark=0.05, backend="reference",
+                          keyframe_interval=KEYFRAME_INTERVAL, background=True, queue_size=64,
+                          policy="block", checkpoint_every=None, resume_from=None, codec=None,
+                          chunk_frames=CHUNK_FRAMES, sampling="every", stride=50, threshold=0.02,
+                          **backend_options):
+    """
+    Run a simulation and stream every frame to a binary recording (see model.recording).
+
+    Frames are written to disk as soon as they are computed, so memory use does not depend
+    on the number of chronons. Between keyframes only the cells touched by the engine are
+    stored. By default frames are encoded and written by a background thread
+    (see model.background_writer), so the simulation does not wait for the disk.
+
+    With `checkpoint_every`, the full state of the world is saved periodically next to the
+    recording (see model.checkpoint); a run killed midway is continued with `resume_from`,
+    which records the remaining chronons into a new recording.
+
+    With a `codec`, frames are stored in independently compressed chunks
+    (see model.chunked_recording) in a .wtc file instead of a plain .wtr recording.
+
+    `sampling` chooses which chronons get a frame (see model.sampling); the first and last
+    chronons are always recorded. In "populations" mode no frame is recorded and only the
+    population histories are saved, as JSON.
+
+    Args:
+        width (int): Width of the simulation grid.
+        height (int): Height of the simulation grid.
+        chronons (int): Number of chronons to simulate.
+        perc_fish (float, optional): Initial fish percentage. Defaults to 0.5.
+        perc_shark (float, optional): Initial shark percentage. Defaults to 0.05.
+        backend (str, optional): Simulation backend, see model.backends. Defaults to "reference".
+        keyframe_interval (int, optional): Number of frames between two full frames.
+            Defaults to KEYFRAME_INTERVAL.
+        background (bool, optional): Write from a background thread. Defaults to True.
+        queue_size (int, optional): Frames the background queue can hold. Defaults to 64.
+        policy (str, optional): "block" waits for room in a full queue, "drop" skips the frame.
+            Defaults to "block".
+        checkpoint_every (int, optional): Save a checkpoint every `checkpoint_every` chronons.
+            Only the reference, fast and sublattice backends can be checkpointed.
+        resume_from (str, optional): Checkpoint to continue from instead of starting a new
+            world; `width`, `height`, the percentages and `backend` are then ignored and
+            `chronons` is the total number of chronons of the run.
+        codec (str, optional): "zlib" or "lzma" to write a chunked compressed recording.
+        chunk_frames (int, optional): Frames per compressed chunk. Defaults to CHUNK_FRAMES.
+        sampling (str, optional): "every", "stride", "populations" or "adaptive".
+            Defaults to "every".
+        stride (int, optional): Chronons between frames ("stride") or largest gap between
+            frames ("adaptive"). Defaults to 50.
+        threshold (float, optional): Relative population change that triggers a frame in
+            "adaptive" mode. Defaults to 0.02.
+        **backend_options: Options of the backend, e.g. `workers` or `rng`, see
+            model.backends.create_backend. Ignored with `resume_from`.
+
+    Returns:
+        str: Path of the recording.
+    """
+
+    if resume_from:
+        world = load_checkpoint(resume_from)
+        width, height = world.width, world.height
+    else:
+        world = create_backend(backend, width=int(width), height=int(height),
+                               perc_fish=perc_fish, perc_shark=perc_shark, **backend_options)
+
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    out_path = os.path.join(OUTPUT_DIR, f"wator_history_grid_{timestamp}_number_of_chronons_{chronons}_size_height{height}x{width}.wtr")
+    if resume_from:
+        out_path = out_path.replace(".wtr", f"_resumed_at_{world.chronon}.wtr")
+    checkpoint_path = os.path.splitext(out_path)[0] + ".ckpt.npz"
+    if codec:
+        out_path = os.path.splitext(out_path)[0] + ".wtc"
+    sampler = make_sampling(sampling, stride, threshold)
+    if not sampler.records_frames:
+        out_path = os.path.splitext(out_path)[0] + ".populations.json"
+        background = False
+
+    writer = None
+    try:
+        if sampler.records_frames:
+            if codec:
+                writer = ChunkedRecordingWriter(out_path, world.width, world.height, keyframe_interval,
+                                                codec=codec, chunk_frames=chunk_frames)
+            else:
+                writer = RecordingWriter(out_path, world.width, world.height, keyframe_interval)
+            if background:
+                writer = BackgroundWriter(writer, queue_size, policy)
+        with writer if writer is not None else contextlib.nullcontext():
+            first = True
+            while True:
+                last = world.chronon >= int(chronons)
+                if writer is not None and (sampler.should_record(world) or first or last):
+                    changes = world.take_changes()
+                    writer.write_frame(world.chronon, world.fish_population, world.shark_population,
+                                       world.grid, None if first else changes)
+                    first = False
+                if last:
+                    break
+                world.step(1)
+                if checkpoint_every and world.chronon % int(checkpoint_every) == 0:
+                    save_checkpoint(world, checkpoint_path)
+    finally:
+        world.close()
+
+    if writer is None:
+        with open(out_path, "w", encoding="utf-8") as f:
+            json.dump({
+                "width": world.width,
+                "height": world.height,
+                "chronons": world.chronon,
+                "fish_population": world.fish_history,
+                "shark_population": world.shark_history
+            }, f)
+
+    print(f"OK Simulation enregistrée dans:\n → {out_path}")
+    print(f"Chronons simulées: {world.chronon}, frames enregistrées: {writer.frame_count if writer else 0}")
+    if checkpoint_every:
+        print(f"Dernier point de reprise: {checkpoint_path}")
+    if background:
+        stats = writer.stats()
+        print(f"Frames écrites: {stats['written']}, ignorées: {stats['dropped']}, "
+              f"file max: {stats['max_queue_depth']}, retard moyen/max: "
+              f"{stats['mean_lag'] * 1000:.1f}/{stats['max_lag'] * 1000:.1f} ms")
+
+    return out_path
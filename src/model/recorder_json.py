@@ -1,22 +1,26 @@
 import json
 import os
 from datetime import datetime
-from .planet_class import WatorPlanet   # adapte si ton fichier ne s'appelle pas wator.py
+from .backends import create_backend
 
 OUTPUT_DIR = "outputs"
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 
-def run_and_record_json(width, height, chronons, perc_fish=0.5, perc_shark=0.05):
-    world = WatorPlanet(width=int(width), height=int(height), 
-                         perc_fish=perc_fish, perc_shark=perc_shark)
+def run_and_record_json(width, height, chronons, perc_fish=0.5, perc_shark=0.05, backend="reference",
+                        **backend_options):
+    world = create_backend(backend, width=int(width), height=int(height),
+                           perc_fish=perc_fish, perc_shark=perc_shark, **backend_options)
 
     history = []
 
-    history.append(world.grid.tolist())
+    try:
+        history.append(world.render().tolist())
 
-    for _ in range(int(chronons)):
-        world.movement_result()
-        history.append(world.grid.tolist())
+        for _ in range(int(chronons)):
+            world.step(1)
+            history.append(world.render().tolist())
+    finally:
+        world.close()
 
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     out_path = os.path.join(OUTPUT_DIR, f"wator_history_grid_{timestamp}_number_of_chronons_{chronons}_size_height{height}x{width}.json")
@@ -36,5 +40,34 @@ def run_and_record_json(width, height, chronons, perc_fish=0.5, perc_shark=0.05)
 
     return out_path
 
+OUTPUT_FORMATS = ("json", "binary", "zlib", "lzma")
+
+
+def run_and_record(width, height, chronons, output_format="binary", **options):
+    """
+    Run and record a simulation in the chosen output format.
+
+    Args:
+        width (int): Width of the simulation grid.
+        height (int): Height of the simulation grid.
+        chronons (int): Number of chronons to simulate.
+        output_format (str, optional): "json" (legacy history), "binary" (streamed .wtr
+            recording) or "zlib"/"lzma" (chunked compressed .wtc recording). Defaults to "binary".
+        **options: Other arguments of run_and_record_json or run_and_record_binary.
+
+    Returns:
+        str: Path of the recording.
+    """
+
+    from .recorder_binary import run_and_record_binary
+
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"Unknown output format {output_format!r}, expected one of {OUTPUT_FORMATS}")
+    if output_format == "json":
+        return run_and_record_json(width, height, chronons, **options)
+    if output_format == "binary":
+        return run_and_record_binary(width, height, chronons, **options)
+    return run_and_record_binary(width, height, chronons, codec=output_format, **options)
+
 if __name__ == "__main__":
     run_and_record_json()
\ No newline at end of file
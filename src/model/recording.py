@@ -0,0 +1,342 @@
+"""
+Binary WA-TOR recordings.
+
+A recording is an append-only file: a fixed-size header followed by one record per frame,
+then a trailing index. Frames are written as soon as they are produced, so recording a run
+needs constant memory whatever its length (apart from 21 bytes of index per frame).
+
+Layout (little-endian):
+
+- header: magic b"WATR", format version (uint16), flags (uint16), width, height and number of
+  frames (uint32), offset of the index (uint64, version 2 only). The number of frames and the
+  index offset are written when the recording is closed; 0 means no index.
+- each record: kind (uint8, 3 padding bytes), chronon, fish count, shark count and payload size
+  in bytes (uint32), then the payload. A FULL_FRAME (keyframe) payload is the grid of cell codes
+  (EMPTY, FISH, SHARK), row by row. Delta frames apply to the previous frame and list the
+  new cell codes of some cells, which are given either as n uint32 flat indices
+  (DELTA_FRAME, the indices come first) or as a bit per cell, packed with np.packbits
+  (MASK_DELTA_FRAME, the mask comes first).
+
+Cell codes are stored one per byte, or 4 per byte (cells.pack_cells) when the PACKED_CELLS
+flag of the header is set, which is the default.
+
+Delta frames are built from the cells the engine reports as touched (take_changes()), not by
+comparing grids. The writer picks the smaller of the two delta layouts for each frame: indices
+when few cells changed, the mask when many did, and falls back to a full frame when no delta
+would be smaller. A keyframe is written every `keyframe_interval` frames, which bounds the
+number of records to replay to reach any frame.
+
+- index: one INDEX_ENTRY per frame (record offset, chronon, fish, sharks, kind), so a reader
+  can seek to any frame and get the population histories without scanning the records.
+  Recordings without an index (version 1, or a writer that did not close) are scanned.
+"""
+
+import struct
+
+import numpy as np
+
+from .cells import pack_cells, packed_size, unpack_cells
+
+MAGIC = b"WATR"
+VERSION = 2
+HEADERS = {1: struct.Struct("<4sHHIII"), 2: struct.Struct("<4sHHIIIQ")}
+HEADER = HEADERS[VERSION]
+RECORD = struct.Struct("<BxxxIIII")
+INDEX_ENTRY = struct.Struct("<QIIIB")
+INDEX_DTYPE = np.dtype([("offset", "<u8"), ("chronon", "<u4"), ("fish", "<u4"),
+                        ("sharks", "<u4"), ("kind", "u1")])
+
+FULL_FRAME = 0
+DELTA_FRAME = 1
+MASK_DELTA_FRAME = 2
+
+PACKED_CELLS = 1
+
+
+def decode_cells(payload: np.ndarray, count: int, packed: bool) -> np.ndarray:
+    """
+    Decode `count` cell codes from the start of a uint8 payload.
+    """
+
+    size = packed_size(count) if packed else count
+    return unpack_cells(payload[:size], count) if packed else payload[:size]
+
+
+def apply_record(cells: np.ndarray, kind: int, payload: np.ndarray, packed: bool) -> None:
+    """
+    Apply the payload of a record to a grid.
+
+    Args:
+        cells (np.ndarray): The flat grid of cell codes, holding the previous frame for deltas.
+        kind (int): Record kind (FULL_FRAME, DELTA_FRAME or MASK_DELTA_FRAME).
+        payload (np.ndarray): The payload as a uint8 array.
+        packed (bool): Whether cell codes are packed at 2 bits per cell.
+    """
+
+    if kind == FULL_FRAME:
+        cells[:] = decode_cells(payload, cells.size, packed)
+    elif kind == DELTA_FRAME:
+        # 4 bytes of index plus 1 or 1/4 byte of cell code per changed cell
+        count = 4 * len(payload) // 17 if packed else len(payload) // 5
+        indices = payload[:4 * count].view(np.uint32)
+        cells[indices] = decode_cells(payload[4 * count:], count, packed)
+    elif kind == MASK_DELTA_FRAME:
+        mask_size = (cells.size + 7) // 8
+        changed = np.unpackbits(payload[:mask_size], count=cells.size).view(bool)
+        cells[changed] = decode_cells(payload[mask_size:], int(np.count_nonzero(changed)), packed)
+    else:
+        raise ValueError(f"Unknown record kind {kind}")
+
+
+class RecordingWriter:
+    """
+    Stream frames of a simulation to a binary recording.
+
+    Attributes:
+        path (str): Path of the recording.
+        width (int): Width of the recorded grid.
+        height (int): Height of the recorded grid.
+        keyframe_interval (int): A full frame is written every `keyframe_interval` frames,
+            delta frames in between. 1 writes only full frames.
+        packed (bool): Whether cell codes are packed at 2 bits per cell.
+        frame_count (int): Number of frames written so far.
+    """
+
+    def __init__(self, path: str, width: int, height: int, keyframe_interval: int = 1,
+                 packed: bool = True):
+        self.path = path
+        self.width = int(width)
+        self.height = int(height)
+        self.keyframe_interval = max(1, int(keyframe_interval))
+        self.packed = packed
+        self.frame_count = 0
+        self.index = bytearray()
+        self.file = open(path, "wb")
+        self.write_header()
+
+    def write_header(self, index_offset: int = 0) -> None:
+        flags = PACKED_CELLS if self.packed else 0
+        self.file.write(HEADER.pack(MAGIC, VERSION, flags, self.width, self.height, self.frame_count,
+                                    index_offset))
+
+    def encoded_size(self, count: int) -> int:
+        return packed_size(count) if self.packed else count
+
+    def encode_cells(self, cells: np.ndarray) -> np.ndarray:
+        if self.packed:
+            return pack_cells(cells)
+        return np.ascontiguousarray(cells, dtype=np.uint8)
+
+    def write_record(self, kind: int, chronon: int, fish: int, sharks: int, payload) -> None:
+        """
+        Append one record.
+
+        Args:
+            kind (int): Record kind (FULL_FRAME, DELTA_FRAME or MASK_DELTA_FRAME).
+            chronon (int): Chronon of the frame.
+            fish (int): Fish population at that chronon.
+            sharks (int): Shark population at that chronon.
+            payload (bytes-like): Encoded frame.
+        """
+
+        payload = memoryview(payload).cast("B")
+        self.index += INDEX_ENTRY.pack(self.file.tell(), chronon, fish, sharks, kind)
+        self.file.write(RECORD.pack(kind, chronon, fish, sharks, payload.nbytes))
+        self.file.write(payload)
+        self.frame_count += 1
+
+    def write_frame(self, chronon: int, fish: int, sharks: int, grid: np.ndarray,
+                    changes: np.ndarray | None = None) -> None:
+        """
+        Append a frame, as a delta from the previous one when possible.
+
+        Args:
+            chronon (int): Chronon of the frame.
+            fish (int): Fish population at that chronon.
+            sharks (int): Shark population at that chronon.
+            grid (np.ndarray): The (height, width) uint8 grid of cell codes.
+            changes (np.ndarray | None, optional): Flat indices of every cell that may have
+                changed since the previous frame. Without it a full frame is written.
+        """
+
+        if self.frame_count % self.keyframe_interval == 0:
+            changes = None
+        kind, payload = self.encode_frame(grid, changes)
+        self.write_record(kind, chronon, fish, sharks, payload)
+
+    def encode_frame(self, grid: np.ndarray, changes: np.ndarray | None) -> tuple[int, bytes]:
+        """
+        Encode a frame as the smallest of a full frame and the two delta layouts.
+
+        Returns:
+            tuple[int, bytes]: The record kind and its payload.
+        """
+
+        cells = grid.reshape(-1)
+        mask_size = (cells.size + 7) // 8
+        if (changes is None
+                or min(4 * len(changes), mask_size) + self.encoded_size(len(changes))
+                >= self.encoded_size(cells.size)):
+            return FULL_FRAME, self.encode_cells(grid).tobytes()
+        values = self.encode_cells(cells[changes])
+        if 4 * len(changes) <= mask_size:
+            return DELTA_FRAME, changes.astype(np.uint32).tobytes() + values.tobytes()
+        mask = np.zeros(cells.size, dtype=bool)
+        mask[changes] = True
+        return MASK_DELTA_FRAME, np.packbits(mask).tobytes() + values.tobytes()
+
+    def close(self) -> None:
+        """
+        Write the index, the final frame count and the index offset, and close the file.
+        """
+
+        if self.file.closed:
+            return
+        index_offset = self.file.tell()
+        self.file.write(self.index)
+        self.file.seek(0)
+        self.write_header(index_offset)
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class RecordingReader:
+    """
+    Random access to the frames of a binary recording.
+
+    The file is memory-mapped and only its header and index are read on opening. Without an
+    index, record offsets are discovered as frames are requested. A frame is decoded from the
+    nearest keyframe, or from the last decoded frame when reading forward, so playback costs
+    one record per frame and seeking at most one keyframe interval of records.
+
+    Attributes:
+        path (str): Path of the recording.
+        width (int): Width of the recorded grid.
+        height (int): Height of the recorded grid.
+        frame_count (int): Number of frames in the recording.
+        packed (bool): Whether cell codes are packed at 2 bits per cell.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.data = np.memmap(path, dtype=np.uint8, mode="r")
+        magic, version = struct.unpack_from("<4sH", self.data, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a WA-TOR recording")
+        if version not in HEADERS:
+            raise ValueError(f"Unsupported recording version {version} in {path}")
+        header = HEADERS[version]
+        _magic, _version, flags, self.width, self.height, self.frame_count, *index_offset = \
+            header.unpack_from(self.data, 0)
+        self.packed = bool(flags & PACKED_CELLS)
+
+        self.offsets = [header.size]
+        self.kinds = []
+        self.chronons = []
+        self.fish = []
+        self.sharks = []
+        if index_offset and index_offset[0]:
+            self.read_index(index_offset[0])
+        elif self.frame_count == 0:
+            self.frame_count = self.scan()
+        self.grid = np.zeros((self.height, self.width), dtype=np.uint8)
+        self.cursor = -1
+
+    def __len__(self) -> int:
+        return self.frame_count
+
+    def read_index(self, offset: int) -> None:
+        index = self.data[offset:offset + self.frame_count * INDEX_DTYPE.itemsize].view(INDEX_DTYPE)
+        self.offsets = index["offset"].tolist() + [offset]
+        self.kinds = index["kind"].tolist()
+        self.chronons = index["chronon"].tolist()
+        self.fish = index["fish"].tolist()
+        self.sharks = index["sharks"].tolist()
+
+    def scan(self) -> int:
+        """
+        Count the complete records of a recording whose writer did not close it.
+        """
+
+        count = 0
+        while self.offsets[-1] + RECORD.size <= len(self.data):
+            size = RECORD.unpack_from(self.data, self.offsets[-1])[-1]
+            if self.offsets[-1] + RECORD.size + size > len(self.data):
+                break
+            self.locate(count)
+            count += 1
+        return count
+
+    def locate(self, index: int) -> int:
+        """
+        Return the file offset of a record, reading the record headers up to it if needed.
+        """
+
+        while len(self.kinds) <= index:
+            offset = self.offsets[-1]
+            kind, chronon, fish, sharks, size = RECORD.unpack_from(self.data, offset)
+            self.kinds.append(kind)
+            self.chronons.append(chronon)
+            self.fish.append(fish)
+            self.sharks.append(sharks)
+            self.offsets.append(offset + RECORD.size + size)
+        return self.offsets[index]
+
+    def apply(self, index: int) -> None:
+        """
+        Decode record `index` into the current grid.
+        """
+
+        start = self.locate(index) + RECORD.size
+        apply_record(self.grid.reshape(-1), self.kinds[index],
+                     self.data[start:self.offsets[index + 1]], self.packed)
+
+    def frame(self, index: int) -> np.ndarray:
+        """
+        Decode a frame.
+
+        Args:
+            index (int): Index of the frame, from 0 to frame_count - 1.
+
+        Returns:
+            np.ndarray: The (height, width) grid of cell codes. The array is reused by the next
+                call; copy it to keep it.
+        """
+
+        if not 0 <= index < self.frame_count:
+            raise IndexError(f"Frame {index} out of range (0-{self.frame_count - 1})")
+        self.locate(index)
+        start = index
+        while self.kinds[start] != FULL_FRAME:
+            start -= 1
+        if start <= self.cursor <= index:
+            start = self.cursor + 1
+        for record in range(start, index + 1):
+            self.apply(record)
+        self.cursor = index
+        return self.grid
+
+    def populations(self) -> tuple[list[int], list[int]]:
+        """
+        Return the fish and shark populations of every frame, reading all record headers.
+        """
+
+        if self.frame_count:
+            self.locate(self.frame_count - 1)
+        return self.fish, self.sharks
+
+    def __iter__(self):
+        """
+        Yield (chronon, fish, sharks, grid) for every frame, in order.
+
+        The same grid array is updated in place from one frame to the next; copy it to keep it.
+        """
+
+        for index in range(self.frame_count):
+            grid = self.frame(index)
+            yield self.chronons[index], self.fish[index], self.sharks[index], grid
@@ -0,0 +1,89 @@
+"""
+Recording policies: which chronons of a run get a frame in the recording.
+
+- "every": every chronon.
+- "stride": every `stride`-th chronon.
+- "populations": no frames at all, only the population histories.
+- "adaptive": densely while the populations change fast, sparsely in steady state. A frame is
+  recorded when the fish or shark population moved by more than `threshold` (relative to its
+  value at the last recorded frame), and at least every `stride` chronons.
+
+Recordings therefore hold frames at non-uniform chronons; every frame carries its chronon.
+Delta frames stay valid across skipped chronons because the engines accumulate touched cells
+until take_changes() is called for the next recorded frame.
+"""
+
+SAMPLING_MODES = ("every", "stride", "populations", "adaptive")
+
+
+class SamplingPolicy:
+    """
+    Decide, after each chronon, whether the current state of the world is recorded.
+    """
+
+    records_frames = True
+
+    def should_record(self, world) -> bool:
+        return True
+
+
+class EveryNth(SamplingPolicy):
+    def __init__(self, stride: int):
+        self.stride = max(1, int(stride))
+
+    def should_record(self, world) -> bool:
+        return world.chronon % self.stride == 0
+
+
+class PopulationsOnly(SamplingPolicy):
+    records_frames = False
+
+    def should_record(self, world) -> bool:
+        return False
+
+
+class Adaptive(SamplingPolicy):
+    def __init__(self, threshold: float = 0.02, max_stride: int = 50):
+        self.threshold = threshold
+        self.max_stride = max(1, int(max_stride))
+        self.last = None
+
+    def should_record(self, world) -> bool:
+        populations = (world.chronon, world.fish_population, world.shark_population)
+        if self.last is not None:
+            chronon, fish, sharks = self.last
+            change = max(abs(world.fish_population - fish) / max(fish, 1),
+                         abs(world.shark_population - sharks) / max(sharks, 1))
+            if change < self.threshold and world.chronon - chronon < self.max_stride:
+                return False
+        self.last = populations
+        return True
+
+
+def make_sampling(mode: str = "every", stride: int = 50, threshold: float = 0.02) -> SamplingPolicy:
+    """
+    Build a recording policy.
+
+    Args:
+        mode (str, optional): One of SAMPLING_MODES. Defaults to "every".
+        stride (int, optional): Chronons between frames for "stride", largest gap between
+            frames for "adaptive". Defaults to 50.
+        threshold (float, optional): Relative population change that triggers a frame in
+            "adaptive" mode. Defaults to 0.02.
+
+    Returns:
+        SamplingPolicy: The policy.
+
+    Raises:
+        ValueError: If the mode is unknown.
+    """
+
+    if mode == "every":
+        return SamplingPolicy()
+    if mode == "stride":
+        return EveryNth(stride)
+    if mode == "populations":
+        return PopulationsOnly()
+    if mode == "adaptive":
+        return Adaptive(threshold, stride)
+    raise ValueError(f"Unknown sampling mode {mode!r}, expected one of {SAMPLING_MODES}")
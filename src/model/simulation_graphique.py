@@ -1,4 +1,5 @@
 import json
+import threading
 import tkinter as tk
 from tkinter import filedialog
 from PIL import Image, ImageTk
@@ -8,7 +9,159 @@ from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import numpy as np
 import os
 
+from .cells import EMPTY, FISH, SHARK, from_chars, pack_cells, packed_size, unpack_cells
+from .recording import RecordingReader
+from .chunked_recording import ChunkedRecordingReader
+from .frame_cache import FrameCache
+from .live_feed import LiveFeed
+
 CELL_SIZE = 12
+DIRTY_TILE = 32  # side, in cells, of the tiles repainted when they change
+LIVE_POLL_MS = 30
+VIEWPORT = (960, 720)  # largest canvas size, in pixels
+# Screen pixels per cell: sprites at CELL_SIZE, flat colors from 1 to 4, and below 1 a density
+# map where each pixel averages a block of 1 / zoom cells per side.
+ZOOM_LEVELS = (1 / 16, 1 / 8, 1 / 4, 1 / 2, 1, 2, 4, CELL_SIZE)
+
+
+class PackedHistory:
+    """
+    An in-memory history of frames packed at 2 bits per cell, for histories loaded from JSON.
+
+    It offers the same frame access as recording.RecordingReader.
+    """
+
+    def __init__(self, frame_count, height, width, fish=None, sharks=None, chronons=None):
+        self.height = height
+        self.width = width
+        self.frames = np.empty((frame_count, packed_size(width * height)), dtype=np.uint8)
+        self.fish = fish or []
+        self.sharks = sharks or []
+        self.chronons = chronons or list(range(frame_count))
+
+    def __len__(self):
+        return len(self.frames)
+
+    def frame(self, idx):
+        return unpack_cells(self.frames[idx], self.width * self.height).reshape(self.height, self.width)
+
+    def populations(self):
+        return self.fish, self.sharks
+
+
+def sprite_atlas(sprite_map, default):
+    """
+    Stack the sprite of every cell code into one array, for render_cells.
+
+    Args:
+        sprite_map (dict): The sprite (PIL image) of each cell code.
+        default (PIL.Image.Image): The sprite of codes missing from sprite_map.
+
+    Returns:
+        numpy.ndarray: A (codes, size, size) array of opaque RGBA pixels packed in uint32.
+    """
+
+    tiles = np.stack([np.asarray(sprite_map.get(code, default).convert("RGBA"))
+                      for code in range(max(sprite_map) + 1)])
+    tiles[..., 3] = 255
+    return np.ascontiguousarray(tiles).view(np.uint32)[..., 0]
+
+
+def render_cells(grid, atlas, out):
+    """
+    Render a grid of cell codes in one NumPy operation: the atlas is indexed with the whole
+    grid and the tiles are laid out row by row into `out`.
+
+    Args:
+        grid (numpy.ndarray): The (height, width) grid of cell codes.
+        atlas (numpy.ndarray): The sprites, from sprite_atlas.
+        out (numpy.ndarray): A (height * size, width * size) uint32 buffer, reused between frames.
+
+    Returns:
+        PIL.Image.Image: An RGBA image sharing the memory of `out`.
+    """
+
+    height, width = grid.shape
+    size = atlas.shape[1]
+    out.reshape(height, size, width, size)[:] = atlas[grid].transpose(0, 2, 1, 3)
+    return pixels_image(out)
+
+
+def sprite_colors(sprite_map, default):
+    """
+    Average color of every cell code's sprite, ignoring its transparent pixels.
+
+    Args:
+        sprite_map (dict): The sprite (PIL image) of each cell code.
+        default (PIL.Image.Image): The sprite of codes missing from sprite_map.
+
+    Returns:
+        numpy.ndarray: A (codes, 3) uint8 array of RGB colors.
+    """
+
+    colors = []
+    for code in range(max(sprite_map) + 1):
+        rgba = np.asarray(sprite_map.get(code, default).convert("RGBA"), dtype=np.float64)
+        weights = rgba[..., 3] if rgba[..., 3].any() else np.ones(rgba.shape[:2])
+        colors.append((rgba[..., :3] * weights[..., None]).sum(axis=(0, 1)) / weights.sum())
+    return np.array(colors).round().astype(np.uint8)
+
+
+def color_atlas(colors, size):
+    """
+    Tiles of `size` pixels filled with the color of each cell code, for render_cells.
+
+    Args:
+        colors (numpy.ndarray): The (codes, 3) colors, from sprite_colors.
+        size (int): Side of the tiles, in pixels.
+
+    Returns:
+        numpy.ndarray: A (codes, size, size) array of opaque RGBA pixels packed in uint32.
+    """
+
+    rgba = np.concatenate([colors, np.full((len(colors), 1), 255, dtype=np.uint8)], axis=1)
+    packed = np.ascontiguousarray(rgba).view(np.uint32).reshape(-1, 1, 1)
+    return np.ascontiguousarray(np.broadcast_to(packed, (len(colors), size, size)))
+
+
+def render_density(grid, colors, block):
+    """
+    Render a grid with one pixel per block of block x block cells, colored with the average
+    color of its cells.
+
+    The grid is cropped to a multiple of `block` cells.
+
+    Args:
+        grid (numpy.ndarray): The (height, width) grid of cell codes.
+        colors (numpy.ndarray): The (codes, 3) colors, from sprite_colors.
+        block (int): Side of the blocks, in cells.
+
+    Returns:
+        tuple[numpy.ndarray, numpy.ndarray]: The fish and shark counts of every block encoded
+            in one uint32 key, and the (height // block, width // block) uint32 RGBA pixels.
+    """
+
+    height, width = grid.shape[0] // block, grid.shape[1] // block
+    blocks = grid[:height * block, :width * block].reshape(height, block, width, block)
+    fish = np.count_nonzero(blocks == FISH, axis=(1, 3))
+    sharks = np.count_nonzero(blocks == SHARK, axis=(1, 3))
+    cells = block * block
+    rgb = (colors[EMPTY].astype(np.int64) * (cells - fish - sharks)[..., None]
+           + colors[FISH].astype(np.int64) * fish[..., None]
+           + colors[SHARK].astype(np.int64) * sharks[..., None]) // cells
+    rgba = np.empty((height, width, 4), dtype=np.uint8)
+    rgba[..., :3] = rgb
+    rgba[..., 3] = 255
+    key = (fish * (cells + 1) + sharks).astype(np.uint32)
+    return key, rgba.view(np.uint32)[..., 0]
+
+
+def pixels_image(pixels):
+    """
+    Wrap a contiguous (height, width) uint32 array of RGBA pixels in a PIL image, without copy.
+    """
+
+    return Image.frombuffer("RGBA", (pixels.shape[1], pixels.shape[0]), pixels, "raw", "RGBA", 0, 1)
 
 
 class WatorViewer:
@@ -17,7 +170,24 @@ class WatorViewer:
 
     This class provides a Tkinter-based interface to visualize the WA-TOR simulation,
     load simulation data from JSON files, and display population statistics over time.
-    It supports playing, pausing, and stepping through the simulation frames.
+    It supports playing, pausing, stepping forward and backward, and jumping to any frame
+    with the timeline slider.
+
+    Frames loaded from JSON are kept in memory packed at 2 bits per cell (see cells.pack_cells);
+    binary recordings are memory-mapped and only their header and index are read when opened.
+    In both cases a frame is decoded only when it is drawn or prefetched: rendered frames are
+    kept in a FrameCache, which renders the frames following the current one in the background.
+
+    Recordings may skip chronons (see model.sampling): the viewer shows and plots the chronon
+    of each frame rather than its index.
+
+    A running simulation can also be watched live (see start_live): the viewer then draws the
+    latest frame published by a LiveFeed at each poll and skips the ones it had no time for.
+
+    Only the part of the grid visible in the canvas (at most VIEWPORT pixels) is rendered, at
+    one of ZOOM_LEVELS: sprites when zoomed in, flat colors around one pixel per cell, and
+    block-averaged density maps for grids larger than the screen. The view is zoomed with the
+    buttons or the mouse wheel and panned by dragging or with the arrow keys.
     """
 
     def __init__(self, root):
@@ -28,6 +198,7 @@ class WatorViewer:
         self.history = None
         self.fish_history = []
         self.shark_history = []
+        self.chronon_history = []
         self.frame_index = 0
         self.running = False
         self.speed = 150
@@ -77,6 +248,27 @@ class WatorViewer:
         self.speed_scale.set(self.speed)
         self.speed_scale.grid(row=0, column=5)
 
+        tk.Button(ctrl, text="⬅ Back", command=self.step_back).grid(row=0, column=8)
+
+        self.label_cache = tk.Label(ctrl, text="Cache: -")
+        self.label_cache.grid(row=0, column=9, padx=10)
+
+        tk.Button(ctrl, text="🔍+", command=lambda: self.zoom_by(1)).grid(row=0, column=10)
+        tk.Button(ctrl, text="🔍−", command=lambda: self.zoom_by(-1)).grid(row=0, column=11)
+        self.canvas.bind("<ButtonPress-1>", self.start_pan)
+        self.canvas.bind("<B1-Motion>", self.drag_pan)
+        self.canvas.bind("<MouseWheel>", lambda event: self.zoom_by(1 if event.delta > 0 else -1))
+        self.canvas.bind("<Button-4>", lambda event: self.zoom_by(1))
+        self.canvas.bind("<Button-5>", lambda event: self.zoom_by(-1))
+        for key, (dx, dy) in {"<Left>": (-1, 0), "<Right>": (1, 0), "<Up>": (0, -1), "<Down>": (0, 1)}.items():
+            root.bind(key, lambda event, dx=dx, dy=dy: self.pan_by(dx, dy))
+
+        self.scrub = tk.Scale(root, from_=0, to=0,
+                              label="Frame",
+                              orient="horizontal",
+                              command=self.seek)
+        self.scrub.pack(fill="x")
+
         self.sprite_fish = Image.open(fish_path)
         self.sprite_shark = Image.open(shark_path)
         self.sprite_empty = Image.new("RGB", (CELL_SIZE, CELL_SIZE), (0, 0, 40))
@@ -87,12 +279,25 @@ class WatorViewer:
         self.sprite_empty = self.sprite_empty.resize((CELL_SIZE, CELL_SIZE))
 
         self.sprite_map = {
-            "F": self.sprite_fish,
-            "S": self.sprite_shark,
-            " ": self.sprite_empty
+            FISH: self.sprite_fish,
+            SHARK: self.sprite_shark,
+            EMPTY: self.sprite_empty
         }
+        self.atlas = sprite_atlas(self.sprite_map, self.sprite_empty)
+        self.colors = sprite_colors(self.sprite_map, self.sprite_empty)
+        self.atlases = {zoom: color_atlas(self.colors, zoom) for zoom in ZOOM_LEVELS if 1 <= zoom < CELL_SIZE}
+        self.atlases[CELL_SIZE] = self.atlas
+        self.zoom = CELL_SIZE
+        self.view_x = self.view_y = 0
+        self.view = None
+        self.pan_anchor = None
+        self.history_lock = threading.Lock()
+        self.cache = FrameCache(self.render_frame)
+        self.live = None
 
         self.tk_img = None  # prevent garbage collection
+        self.canvas_item = None
+        self.shown_grid = None
 
     # JSON Gestion
 
@@ -109,11 +314,15 @@ class WatorViewer:
         path = filedialog.askopenfilename(
             title="Choisir un fichier JSON",
             initialdir=DEFAULT_DIR,
-            filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
+            filetypes=[("WA-TOR files", "*.json *.wtr *.wtc"), ("JSON files", "*.json"),
+                       ("Recordings", "*.wtr *.wtc"), ("All files", "*.*")]
         )
         if not path:
             return
-        self.load_json(path)
+        if path.endswith((".wtr", ".wtc")):
+            self.load_recording(path)
+        else:
+            self.load_json(path)
 
     def load_json(self, path):
         """
@@ -127,25 +336,36 @@ class WatorViewer:
             filepath (str): Path to the JSON file to load.
         """
 
+        self.stop_live()
+        self.cache.reset(0, 0)
         print(path)
         with open(path, "r", encoding="utf-8") as f:
             data = json.load(f)
             
         self.fish_history = []
         self.shark_history = []
+        self.chronon_history = []
         self.frame_index = 0
 
+        # Populations-only recordings (model.sampling) have no grids: only the statistics are shown.
+        if "fish_population" in data:
+            self.history = None
+            self.fish_history = data["fish_population"]
+            self.shark_history = data["shark_population"]
+            self.chronon_history = list(range(len(self.fish_history)))
+            self.update_population_stats()
+            self.open_stats_window()
+            return
+
         # Two possible formats:
         # 1) {"history": [grid0, grid1, ...]} where grid is list of rows
         # 2) {"frames": [{"grid": grid0, "fish": n, "sharks": m}, ...]}
+        # Each grid is converted to cell codes (EMPTY, FISH, SHARK) and packed once loaded.
         if "history" in data:
-            self.history = np.array(data["history"])
-            self.fish_history = [int((frame == "F").sum()) for frame in self.history]
-            self.shark_history = [int((frame == "S").sum()) for frame in self.history]
+            grids = data["history"]
         elif "frames" in data:
-            frames = data["frames"]
             grids = []
-            for f in frames:
+            for f in data["frames"]:
                 if "grid" in f:
                     grids.append(f["grid"])
                 else:
@@ -153,47 +373,90 @@ class WatorViewer:
                 if "fish" in f and "sharks" in f:
                     self.fish_history.append(int(f["fish"]))
                     self.shark_history.append(int(f["sharks"]))
-            self.history = np.array(grids)
-            if not self.fish_history:
-                self.fish_history = [int((frame == "F").sum()) for frame in self.history]
-            if not self.shark_history:
-                self.shark_history = [int((frame == "S").sum()) for frame in self.history]
-    
-        self.frames, self.height, self.width = self.history.shape
+                if "chronon" in f:
+                    self.chronon_history.append(int(f["chronon"]))
+        counted = not self.fish_history
+
+        self.height, self.width = len(grids[0]), len(grids[0][0])
+        self.history = PackedHistory(len(grids), self.height, self.width,
+                                     self.fish_history, self.shark_history, self.chronon_history)
+        for index, chars in enumerate(grids):
+            grid = from_chars(chars)
+            self.history.frames[index] = pack_cells(grid)
+            if counted:
+                self.fish_history.append(int(np.count_nonzero(grid == FISH)))
+                self.shark_history.append(int(np.count_nonzero(grid == SHARK)))
+
+        self.show_history()
+
+    def load_recording(self, path):
+        """
+        Open a binary recording written by model.recorder_binary, plain (.wtr) or chunked (.wtc).
 
-        if self.fish_history:
-            self.min_fish = int(min(self.fish_history))
-            self.max_fish = int(max(self.fish_history))
-        else:
-            self.min_fish = self.max_fish = 0
+        Only the header and index are read here; frames are decoded on demand by draw_frame,
+        and the population histories are taken from the index when the statistics are shown.
 
-        if self.shark_history:
-            self.min_shark = int(min(self.shark_history))
-            self.max_shark = int(max(self.shark_history))
-        else:
-            self.min_shark = self.max_shark = 0
+        Args:
+            path (str): Path to the recording to load.
+        """
+
+        self.stop_live()
+        self.cache.reset(0, 0)
+        print(path)
+        self.history = ChunkedRecordingReader(path) if path.endswith(".wtc") else RecordingReader(path)
+        self.height, self.width = self.history.height, self.history.width
+        self.fish_history = []
+        self.shark_history = []
+        self.chronon_history = []
+        self.frame_index = 0
 
-        # configure canvas
-        self.canvas.config(width=self.width * CELL_SIZE,
-                           height=self.height * CELL_SIZE)
+        self.show_history()
+
+    def show_history(self):
+        """
+        Compute the population statistics of the loaded history and show its first frame.
+        """
+
+        self.frames = len(self.history)
+        self.update_population_stats()
+        self.scrub.config(to=max(self.frames - 1, 0))
 
         self.frame_index = 0
+        self.fit_view()
         self.draw_frame(0)
 
-        print(f"OK JSON chargé ({self.width}×{self.height}) — {self.frames} Chronons")
+        print(f"OK Historique chargé ({self.width}×{self.height}) — {self.frames} Chronons")
         print(f"Fish history (sample): {self.fish_history[:5]} ...")
         print(f"Shark history (sample): {self.shark_history[:5]} ...")
         print(f"Fish min/max: {self.min_fish}/{self.max_fish}")
         print(f"Shark min/max: {self.min_shark}/{self.max_shark}")
 
-        print(f"OK JSON chargé ({self.width}×{self.height}) — {self.frames} Chronons")
+        print(f"OK Historique chargé ({self.width}×{self.height}) — {self.frames} Chronons")
+
+    def update_population_stats(self):
+        """
+        Compute the min/max populations of the loaded population histories.
+        """
+
+        if self.fish_history:
+            self.min_fish = int(min(self.fish_history))
+            self.max_fish = int(max(self.fish_history))
+        else:
+            self.min_fish = self.max_fish = 0
+
+        if self.shark_history:
+            self.min_shark = int(min(self.shark_history))
+            self.max_shark = int(max(self.shark_history))
+        else:
+            self.min_shark = self.max_shark = 0
 
 
     def draw_frame(self, idx):
         """
         Draw the current simulation frame on the canvas.
         It uses the preloaded sprites to represent fish, sharks, and empty cells.
-        The technique involves creating a full PIL image for efficiency, then converting it to a Tkinter image for display.
+        Only the visible part of the frame is rendered, at the current zoom (see render_view),
+        and only the tiles that changed since the previous frame are repainted (see paint_grid).
 
         Args:
             frame_index (int): The index of the frame to draw.
@@ -201,25 +464,212 @@ class WatorViewer:
 
         if self.history is None:
             return
-        if self.frame_index == (self.frames-1):
-            self.running = False
-            self.open_stats_window()
-        grid = self.history[idx]
+        self.show_frame(idx)
 
-        self.update_population_labels(grid)
-        frame_img = Image.new("RGB", (self.width * CELL_SIZE, self.height * CELL_SIZE))
+    def show_frame(self, idx):
+        """
+        Paint a frame of the loaded history and update the labels and the timeline.
+
+        Args:
+            idx (int): The index of the frame.
+        """
+
+        key, pixels, counts = self.cache.get(idx)
+
+        self.update_population_labels(*counts)
+        self.paint_grid(key, pixels)
+
+        chronons = self.history.chronons
+        self.label_frame.config(text=f"Chronons: {chronons[idx]}/{chronons[-1]}")
+        self.scrub.set(idx)
+        stats = self.cache.stats()
+        self.label_cache.config(text=f"Cache: {stats['hit_rate']:.0%} hits, "
+                                     f"prefetch {stats['window'] - stats['lag']}/{stats['window']} "
+                                     f"({stats['fill_time'] * 1000:.0f} ms)")
+
+    def paint_grid(self, grid, pixels):
+        """
+        Show a grid on the canvas, repainting only what changed since the previously shown grid.
+
+        The canvas keeps one image item and one PhotoImage for the whole playback; they are only
+        recreated when the view changes. The grid is split in tiles of DIRTY_TILE cells, and
+        in each row of tiles the span of changed tiles is copied into the photo. When most tiles
+        changed, the whole frame is pasted instead.
+
+        Args:
+            grid (numpy.ndarray): The (height, width) array rendered, cell codes or density keys
+                (see render_view).
+            pixels (numpy.ndarray): The rendered pixels, the same number for every grid element.
+        """
+
+        height, width = grid.shape
+        scale = pixels.shape[0] // height
+        if self.shown_grid is None or self.shown_grid.shape != grid.shape:
+            self.tk_img = ImageTk.PhotoImage(pixels_image(pixels))
+            if self.canvas_item is not None:
+                self.canvas.delete(self.canvas_item)
+            self.canvas_item = self.canvas.create_image(0, 0, anchor="nw", image=self.tk_img)
+            self.shown_grid = grid.copy()
+            return
+
+        changed = grid != self.shown_grid
+        dirty = np.logical_or.reduceat(changed, np.arange(0, height, DIRTY_TILE), axis=0)
+        dirty = np.logical_or.reduceat(dirty, np.arange(0, width, DIRTY_TILE), axis=1)
+        if not dirty.any():
+            return
+
+        if np.count_nonzero(dirty) * 2 > dirty.size:
+            self.tk_img.paste(pixels_image(pixels))
+        else:
+            for row in np.flatnonzero(dirty.any(axis=1)):
+                columns = np.flatnonzero(dirty[row])
+                y0, y1 = row * DIRTY_TILE, min((row + 1) * DIRTY_TILE, height)
+                x0, x1 = columns[0] * DIRTY_TILE, min((columns[-1] + 1) * DIRTY_TILE, width)
+                patch = ImageTk.PhotoImage(pixels_image(np.ascontiguousarray(
+                    pixels[y0 * scale:y1 * scale, x0 * scale:x1 * scale])))
+                self.canvas.tk.call(str(self.tk_img), "copy", str(patch),
+                                    "-to", x0 * scale, y0 * scale)
+        self.shown_grid[:] = grid
+
+    def frame_grid(self, idx):
+        """
+        Decode a frame of the loaded history.
+
+        The history readers reuse their buffers and are shared with the prefetch thread, so
+        frames are decoded under a lock and copied.
+
+        Args:
+            idx (int): The index of the frame.
+
+        Returns:
+            numpy.ndarray: The (height, width) grid of cell codes of the frame.
+        """
+
+        with self.history_lock:
+            return self.history.frame(idx).copy()
+
+    def render_frame(self, idx):
+        """
+        Decode a frame and render its visible part, for the frame cache.
+
+        Args:
+            idx (int): The index of the frame.
+
+        Returns:
+            tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]: The rendered grid and pixels
+                (see render_view) and the fish and shark counts of the whole frame.
+        """
+
+        grid = self.frame_grid(idx)
+        counts = np.array([np.count_nonzero(grid == FISH), np.count_nonzero(grid == SHARK)])
+        return (*self.render_view(grid, self.view), counts)
+
+    def render_view(self, grid, view):
+        """
+        Render the visible part of a grid.
+
+        Args:
+            grid (numpy.ndarray): The (height, width) grid of cell codes.
+            view (tuple): Zoom and visible cells (zoom, y0, y1, x0, x1), from update_view.
+
+        Returns:
+            tuple[numpy.ndarray, numpy.ndarray]: The visible cell codes, or the density keys of
+                its blocks when zoomed out, and the uint32 RGBA pixels.
+        """
+
+        zoom, y0, y1, x0, x1 = view
+        visible = grid[y0:y1, x0:x1]
+        if zoom < 1:
+            return render_density(visible, self.colors, round(1 / zoom))
+        pixels = np.empty((visible.shape[0] * zoom, visible.shape[1] * zoom), dtype=np.uint32)
+        render_cells(visible, self.atlases[zoom], pixels)
+        return visible.copy(), pixels
+
+    def fit_view(self):
+        """
+        Choose the largest zoom at which the whole grid fits in the viewport, and show it all.
+        """
+
+        fitting = [zoom for zoom in ZOOM_LEVELS
+                   if self.width * zoom <= VIEWPORT[0] and self.height * zoom <= VIEWPORT[1]]
+        self.zoom = fitting[-1] if fitting else ZOOM_LEVELS[0]
+        self.view_x = self.view_y = 0
+        self.update_view()
+
+    def update_view(self):
+        """
+        Clamp the view to the grid, resize the canvas to it and drop the frames rendered for
+        the previous view.
+        """
+
+        block = max(1, round(1 / self.zoom))
+        scale = max(1, int(self.zoom))
+        columns = min(self.width // block, VIEWPORT[0] // scale) * block
+        rows = min(self.height // block, VIEWPORT[1] // scale) * block
+        self.view_x = min(max(int(self.view_x), 0), self.width - columns) // block * block
+        self.view_y = min(max(int(self.view_y), 0), self.height - rows) // block * block
+        self.view = (self.zoom, self.view_y, self.view_y + rows, self.view_x, self.view_x + columns)
+
+        pixels = (rows // block * scale, columns // block * scale)
+        self.canvas.config(width=pixels[1], height=pixels[0])
+        self.shown_grid = None
+        if self.history is not None:
+            self.cache.reset(self.frames, rows * columns // block ** 2 * 4 + pixels[0] * pixels[1] * 4)
+
+    def change_view(self):
+        self.update_view()
+        if self.history is not None:
+            self.show_frame(self.frame_index)
+
+    def zoom_by(self, steps):
+        """
+        Zoom in (steps > 0) or out (steps < 0) by whole levels, around the center of the view.
+
+        Args:
+            steps (int): Number of ZOOM_LEVELS to move.
+        """
 
-        for y in range(self.height):
-            for x in range(self.width):
-                tile = self.sprite_map.get(grid[y][x], self.sprite_empty)
-                frame_img.paste(tile, (x * CELL_SIZE, y * CELL_SIZE))
+        if self.view is None:
+            return
+        level = ZOOM_LEVELS.index(self.zoom) + steps
+        level = min(max(level, 0), len(ZOOM_LEVELS) - 1)
+        while ZOOM_LEVELS[level] < 1 and round(1 / ZOOM_LEVELS[level]) > min(self.width, self.height):
+            level += 1
+        _, y0, y1, x0, x1 = self.view
+        center_x, center_y = (x0 + x1) / 2, (y0 + y1) / 2
+        self.zoom = ZOOM_LEVELS[level]
+        scale = max(1, int(self.zoom))
+        block = max(1, round(1 / self.zoom))
+        self.view_x = center_x - VIEWPORT[0] // scale * block / 2
+        self.view_y = center_y - VIEWPORT[1] // scale * block / 2
+        self.change_view()
+
+    def pan_by(self, dx, dy):
+        """
+        Move the view by a quarter of its size.
 
-        self.tk_img = ImageTk.PhotoImage(frame_img)
-        self.canvas.create_image(0, 0, anchor="nw", image=self.tk_img)
+        Args:
+            dx (int): -1 (left), 0 or 1 (right).
+            dy (int): -1 (up), 0 or 1 (down).
+        """
 
-        self.label_frame.config(text=f"Chronons: {idx}/{self.frames-1}")
+        if self.view is None:
+            return
+        _, y0, y1, x0, x1 = self.view
+        self.view_x += dx * max(1, (x1 - x0) // 4)
+        self.view_y += dy * max(1, (y1 - y0) // 4)
+        self.change_view()
 
+    def start_pan(self, event):
+        self.pan_anchor = (event.x, event.y, self.view_x, self.view_y)
 
+    def drag_pan(self, event):
+        if self.view is None or self.pan_anchor is None:
+            return
+        x, y, view_x, view_y = self.pan_anchor
+        self.view_x = view_x - (event.x - x) / self.zoom
+        self.view_y = view_y - (event.y - y) / self.zoom
+        self.change_view()
 
     def update_speed(self, v):
         """
@@ -266,32 +716,125 @@ class WatorViewer:
         self.frame_index = (self.frame_index + 1) % self.frames
         self.draw_frame(self.frame_index)
 
+    def step_back(self):
+        """
+        Go back by one frame.
+
+        The previous frame is rebuilt from the nearest keyframe of the history.
+        """
+
+        self.pause()
+        if self.history is None:
+            return
+        self.frame_index = (self.frame_index - 1) % self.frames
+        self.draw_frame(self.frame_index)
+
+    def seek(self, v):
+        """
+        Jump to the frame selected with the timeline slider.
+
+        Args:
+            v (str): The slider value, a frame index.
+        """
+
+        idx = int(float(v))
+        if self.history is None or idx == self.frame_index:
+            return
+        self.frame_index = idx
+        self.draw_frame(idx)
+
     def update_loop(self):
         """
         Update the simulation frame in a loop while the simulation is running.
 
         This method advances the frame index, redraws the current frame, and schedules the next update.
         If the simulation is paused or no history is loaded, the loop stops.
+        When playback reaches the last frame, it stops and the statistics window is opened.
         """
 
         if not self.running or self.history is None:
             return
         self.frame_index = (self.frame_index + 1) % self.frames
         self.draw_frame(self.frame_index)
+        if self.frame_index == self.frames - 1:
+            self.running = False
+            self.open_stats_window()
+            return
         self.root.after(self.speed, self.update_loop)
 
-    def update_population_labels(self, grid):
+    def start_live(self, world, chronons=None):
         """
-        Update the labels displaying the current fish and shark populations.
+        Watch a simulation as it runs.
 
-        Counts the number of fish ("F") and sharks ("S") in the current grid and updates the corresponding labels.
+        The world is stepped by a LiveFeed worker thread; the viewer polls it every LIVE_POLL_MS
+        and draws its latest frame. Pause stops drawing but not the simulation.
 
         Args:
-            grid (numpy.ndarray): The current state of the simulation grid.
+            world (WatorBackend): The simulation to run, see model.backends.create_backend.
+            chronons (int | None, optional): Chronon at which to stop, or None to run until
+                another history is loaded.
         """
 
-        fish_count = np.count_nonzero(grid == "F")
-        shark_count = np.count_nonzero(grid == "S")
+        self.stop_live()
+        self.cache.reset(0, 0)
+        self.history = None
+        self.height, self.width = world.height, world.width
+        self.fish_history = []
+        self.shark_history = []
+        self.chronon_history = []
+        self.fit_view()
+        self.live = LiveFeed(world, chronons)
+        self.running = True
+        self.poll_live()
+
+    def poll_live(self):
+        """
+        Draw the latest frame of the live simulation, and open the statistics when it ends.
+        """
+
+        live = self.live
+        if live is None:
+            return
+        frame = live.latest()
+        if frame is not None and self.running:
+            chronon, fish, sharks, grid = frame
+            self.paint_grid(*self.render_view(grid, self.view))
+            self.update_population_labels(fish, sharks)
+            self.label_frame.config(text=f"Chronons: {chronon} (live)")
+        elif frame is not None:
+            live.skipped += 1
+        self.label_cache.config(text=f"Live: {live.produced} frames, "
+                                     f"{live.skipped + live.dropped} ignorées")
+
+        if live.finished:
+            self.stop_live()
+            self.running = False
+            self.open_stats_window()
+        else:
+            self.root.after(LIVE_POLL_MS, self.poll_live)
+
+    def stop_live(self):
+        """
+        Stop the live simulation, if any, and keep its population histories for the statistics.
+        """
+
+        if self.live is None:
+            return
+        live, self.live = self.live, None
+        live.stop()
+        self.fish_history = list(live.fish_history)
+        self.shark_history = list(live.shark_history)
+        self.chronon_history = list(live.chronon_history)
+        self.update_population_stats()
+
+    def update_population_labels(self, fish_count, shark_count):
+        """
+        Update the labels displaying the current fish and shark populations.
+
+        Args:
+            fish_count (int): Number of fish (FISH) in the current grid.
+            shark_count (int): Number of sharks (SHARK) in the current grid.
+        """
 
         self.label_fish.config(text=f"Fish: {fish_count}")
         self.label_shark.config(text=f"Sharks: {shark_count}")
@@ -306,6 +849,17 @@ class WatorViewer:
         The plot is embedded in the window using a Tkinter canvas.
         """
 
+        # Without an index the reader scans its records here, so it is shared with the
+        # prefetch thread under the history lock, like in frame_grid.
+        if self.history is not None and len(self.fish_history) < self.frames:
+            with self.history_lock:
+                fish, sharks = self.history.populations()
+                self.fish_history, self.shark_history = list(fish), list(sharks)
+            self.update_population_stats()
+        if self.history is not None and len(self.chronon_history) < self.frames:
+            with self.history_lock:
+                self.chronon_history = list(self.history.chronons)
+
         win = tk.Toplevel(self.root)
         win.title("Population Stats")
         win.geometry("600x500")  # plus grand pour accueillir le graphique
@@ -319,12 +873,12 @@ class WatorViewer:
         tk.Label(stats_frame, text=f"🦈 Shark max : {self.max_shark}").pack(anchor="w", padx=10)
         tk.Label(stats_frame, text=f"🦈 Shark min : {self.min_shark}").pack(anchor="w", padx=10)
 
-        tk.Label(stats_frame, text=f"Chronons : {len(self.fish_history)-1}").pack(anchor="w", padx=10)
+        tk.Label(stats_frame, text=f"Chronons : {self.chronon_history[-1] if self.chronon_history else 0}").pack(anchor="w", padx=10)
 
         fig, ax = plt.subplots(figsize=(5, 3), dpi=100)
 
-        ax.plot(self.fish_history, label="Fish", color="blue")
-        ax.plot(self.shark_history, label="Sharks", color="red")
+        ax.plot(self.chronon_history, self.fish_history, label="Fish", color="blue")
+        ax.plot(self.chronon_history, self.shark_history, label="Sharks", color="red")
 
         ax.set_title("Population Fish Time")
         ax.set_xlabel("Chronons")
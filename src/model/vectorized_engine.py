@@ -0,0 +1,316 @@
+"""
+Synchronous, whole-array update engine for WatorPlanet.
+
+Instead of moving animals one at a time in a random order, a chronon updates every fish at
+once, then every shark at once, with NumPy operations on the planet's entity store, grid,
+occupancy index and neighbor table. Reproduction and starvation use the same timers as
+Fish.canReproduce and Shark.decrementEnergy.
+
+The result is not step-identical to the sequential engine, and not quite statistically
+equivalent either:
+
+- Animals move in rounds. In each round, the animals that can still move choose among the
+  cells that are empty (or hold a fish, for sharks) at that moment; when several pick the same
+  cell, the one with the lowest random priority wins. The losers, and the blocked animals next
+  to a cell vacated meanwhile, try again in the next round, so an animal is only blocked when
+  no free neighbor is left, as in the sequential engine.
+- All fish move before any shark, so sharks always hunt fish at their post-move positions.
+  This is the remaining bias: on a 100x100 world with 50% fish and 5% sharks, the mean
+  populations over chronons 50 to 200 of 24 seeds differ from the sequential ones by about -1%
+  for fish and +5% for sharks (standard errors under 0.5%). compare_schedulers(...,
+  engine="vectorized") in sublattice_engine measures it for other settings.
+- As in the sequential engine, newborns appear in their parent's old cell and only start
+  moving at the next chronon.
+"""
+
+import numpy as np
+
+from .cells import EMPTY, FISH, SHARK
+
+
+def build_choice_table() -> np.ndarray:
+    """
+    Build the lookup table used to draw a uniform random neighbor from a 4-bit mask.
+
+    Entry `mask * 12 + draw` is, for each of 12 random draws, the index of one of the neighbors
+    whose bit is set in `mask`. Since 12 is a multiple of 1, 2, 3 and 4, each allowed neighbor
+    appears equally often for a given mask. Entries of empty masks are 0 and must be ignored.
+
+    Returns:
+        np.ndarray: A flat array of 16 * 12 neighbor indices.
+    """
+
+    table = np.zeros((16, 12), dtype=np.uint8)
+    for mask in range(16):
+        bits = [k for k in range(4) if mask >> k & 1]
+        if bits:
+            table[mask] = [bits[draw % len(bits)] for draw in range(12)]
+    return table.reshape(-1)
+
+
+CHOICE_TABLE = build_choice_table()
+DIRECTIONS = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+MASK_WEIGHTS = np.array([1, 2, 4, 8], dtype=np.uint8)
+
+
+def neighbor_masks(planet, cells: np.ndarray, content: int) -> np.ndarray:
+    """
+    Compute, for each given cell, a 4-bit mask of the neighbors holding `content`.
+
+    Bit k is set when neighbor k of the planet's neighbor table matches. For large batches the
+    masks of the whole grid are built with four grid shifts, which is much cheaper than
+    gathering each animal's neighbors; small batches gather through the neighbor table.
+
+    Args:
+        planet (WatorPlanet): The planet to inspect.
+        cells (np.ndarray): Flat indices of the cells to inspect.
+        content (int): EMPTY, FISH or SHARK.
+
+    Returns:
+        np.ndarray: A uint8 array with one mask per given cell.
+    """
+
+    if 8 * len(cells) < planet.cells.size:
+        matches = planet.cells[planet.neighbors[cells]] == content
+        return matches.view(np.uint8) @ MASK_WEIGHTS
+    matches = planet.grid == content
+    masks = np.zeros(matches.shape, dtype=np.uint8)
+    for k, (delta_x, delta_y) in enumerate(DIRECTIONS):
+        shifted = np.roll(matches, (-delta_x, -delta_y), axis=(0, 1))
+        masks |= shifted.view(np.uint8) << k
+    return masks.reshape(-1)[cells]
+
+
+def choose_targets(planet, cells: np.ndarray, masks: np.ndarray) -> np.ndarray:
+    """
+    Pick one random allowed neighbor for each animal.
+
+    Args:
+        planet (WatorPlanet): The planet whose neighbor table and random generator are used.
+        cells (np.ndarray): Flat indices of the animals' cells.
+        masks (np.ndarray): 4-bit mask of the eligible neighbors of each animal.
+
+    Returns:
+        np.ndarray: The chosen cell of each animal, meaningless where its mask is 0.
+    """
+
+    draws = planet.rng.integers(0, 12, size=len(cells), dtype=np.uint8)
+    choice = CHOICE_TABLE[masks.astype(np.intp) * 12 + draws]
+    return planet.neighbors.reshape(-1)[cells * 4 + choice]
+
+
+def resolve_conflicts(planet, targets: np.ndarray, candidates: np.ndarray | None = None,
+                      size: int | None = None) -> np.ndarray:
+    """
+    Decide which movers get their target cell when several of them picked the same one.
+
+    Candidates get distinct random priorities (a permutation), so each target cell has exactly
+    one winner, the candidate with the lowest priority. Small batches number their distinct
+    targets first, so that the work does not depend on the size of the grid.
+
+    Args:
+        planet (WatorPlanet): The planet whose random generator is used.
+        targets (np.ndarray): Target cell of each animal.
+        candidates (np.ndarray | None, optional): Boolean array, True for the animals that have
+            a target. Defaults to all of them.
+        size (int | None, optional): Upper bound of the target indices. Defaults to the number of
+            cells; callers working on part of the grid pass local indices and a smaller bound.
+
+    Returns:
+        np.ndarray: The positions (in `targets`) of the animals that won their target.
+    """
+
+    chosen = np.arange(len(targets)) if candidates is None else np.flatnonzero(candidates)
+    targets = targets[chosen]
+    count = len(chosen)
+    priorities = planet.rng.permutation(count)
+    if size is None:
+        size = planet.width * planet.height
+    if 8 * count < size:
+        distinct, targets = np.unique(targets, return_inverse=True)
+        size = len(distinct)
+    best = np.full(size, count, dtype=priorities.dtype)
+    np.minimum.at(best, targets, priorities)
+    return chosen[best[targets] == priorities]
+
+
+def spawn_newborns(planet, parents: np.ndarray, cells: np.ndarray, species: int) -> np.ndarray:
+    """
+    Create one newborn per parent in the parent's old cell and reset the parents' timers.
+
+    Args:
+        planet (WatorPlanet): The planet to update.
+        parents (np.ndarray): Entity ids of the reproducing animals.
+        cells (np.ndarray): Cells the parents are leaving.
+        species (int): FISH or SHARK.
+
+    Returns:
+        np.ndarray: Entity ids of the newborns.
+    """
+
+    store = planet.store
+    babies = store.add_many(species, cells,
+                            reproduction_time=store.reproduction_time[parents],
+                            starvation_time=store.starvation_time[parents],
+                            energy=store.initial_energy[parents])
+    store.time_left[parents] = store.reproduction_time[parents]
+    planet.cells[cells] = species
+    planet.occupants[cells] = babies
+    return babies
+
+
+def retrying(planet, slots: np.ndarray, count: int, lost: np.ndarray,
+             vacated: np.ndarray) -> np.ndarray:
+    """
+    Select the animals of the next round: the ones that lost a contested cell, and the ones
+    that have not moved yet and are next to a cell vacated in this round. The other animals
+    that have not moved yet would still find all their neighbors taken.
+
+    Args:
+        planet (WatorPlanet): The planet being updated.
+        slots (np.ndarray): Position of each cell's animal among the animals of the phase, or -1
+            when the cell holds none of them or its animal has already moved.
+        count (int): Number of animals of the phase.
+        lost (np.ndarray): Positions of the animals that lost a contested cell.
+        vacated (np.ndarray): Cells that became empty in this round.
+
+    Returns:
+        np.ndarray: Positions of the animals of the next round, in increasing order.
+    """
+
+    near = slots[planet.neighbors[vacated]].reshape(-1)
+    queued = np.zeros(count, dtype=bool)
+    queued[near[near >= 0]] = True
+    queued[lost] = True
+    return np.flatnonzero(queued)
+
+
+def decrement_time_left(store, ids: np.ndarray) -> None:
+    time_left = store.time_left[ids]
+    store.time_left[ids] = time_left - (time_left > 0)
+
+
+def move_fishes(planet, cells: np.ndarray) -> None:
+    """
+    Move every given fish to a random empty neighbor, breeding when its timer allows.
+
+    The fish move in rounds: in each round the fish that can still move pick an empty neighbor
+    of the current grid and one fish per contested cell wins it. Losers, and blocked fish next
+    to a cell vacated meanwhile, try again in the next round, until no fish can move.
+
+    Args:
+        planet (WatorPlanet): The planet to update.
+        cells (np.ndarray): Flat indices of the cells of the fish to move, in increasing order.
+    """
+
+    store = planet.store
+    fishes = planet.occupants[cells]
+    active = np.arange(len(cells))
+    slots = np.full(planet.cells.size, -1, dtype=np.intp)
+    slots[cells] = active
+    while len(active):
+        masks = neighbor_masks(planet, cells[active], EMPTY)
+        free = masks != 0
+        active, masks = active[free], masks[free]
+        if not len(active):
+            break
+        targets = choose_targets(planet, cells[active], masks)
+
+        won = resolve_conflicts(planet, targets)
+        movers, sources, targets = fishes[active[won]], cells[active[won]], targets[won]
+        slots[sources] = -1
+
+        breeding = store.time_left[movers] <= 0
+        planet.cells[sources] = EMPTY
+        planet.occupants[sources] = -1
+        babies = spawn_newborns(planet, movers[breeding], sources[breeding], FISH)
+        planet.fish_population += len(babies)
+
+        store.pos[movers] = targets
+        planet.cells[targets] = FISH
+        planet.occupants[targets] = movers
+        planet.record_changes(sources, targets)
+        active = retrying(planet, slots, len(cells), np.delete(active, won), sources[~breeding])
+    decrement_time_left(store, fishes)
+
+
+def move_sharks(planet, cells: np.ndarray) -> None:
+    """
+    Move every given shark: eat a neighboring fish if any, otherwise move to an empty neighbor,
+    otherwise lose energy. Sharks breed when their timer allows and die when their energy
+    reaches zero.
+
+    The sharks move in rounds like the fish (see move_fishes); a shark that lost its prey to
+    another shark hunts or moves again with the fish that are left.
+
+    Args:
+        planet (WatorPlanet): The planet to update.
+        cells (np.ndarray): Flat indices of the cells of the sharks to move, in increasing order.
+    """
+
+    store = planet.store
+    sharks = planet.occupants[cells]
+    active = np.arange(len(cells))
+    slots = np.full(planet.cells.size, -1, dtype=np.intp)
+    slots[cells] = active
+    while len(active):
+        prey = neighbor_masks(planet, cells[active], FISH)
+        hunting = prey != 0
+        masks = np.where(hunting, prey, neighbor_masks(planet, cells[active], EMPTY))
+        free = masks != 0
+        active, hunting, masks = active[free], hunting[free], masks[free]
+        if not len(active):
+            break
+        targets = choose_targets(planet, cells[active], masks)
+
+        moving = resolve_conflicts(planet, targets)
+        movers, sources, targets = sharks[active[moving]], cells[active[moving]], targets[moving]
+        slots[sources] = -1
+
+        eating = hunting[moving]
+        eaten = planet.occupants[targets[eating]]
+        store.die_many(eaten)
+        store.energy[movers[eating]] += 1
+        planet.fish_population -= len(eaten)
+
+        breeding = store.time_left[movers] <= 0
+        planet.cells[sources] = EMPTY
+        planet.occupants[sources] = -1
+        babies = spawn_newborns(planet, movers[breeding], sources[breeding], SHARK)
+        planet.shark_population += len(babies)
+
+        store.pos[movers] = targets
+        decrement_time_left(store, movers)
+        store.energy[movers] -= 1
+        starved = store.energy[movers] <= 0
+        planet.cells[targets] = np.where(starved, EMPTY, SHARK)
+        planet.occupants[targets] = np.where(starved, -1, movers)
+        store.die_many(movers[starved])
+        planet.shark_population -= int(starved.sum())
+        planet.record_changes(sources, targets)
+        active = retrying(planet, slots, len(cells), np.delete(active, moving),
+                          np.concatenate([sources[~breeding], targets[starved]]))
+
+    blocked = slots[cells] >= 0
+    stuck, stuck_cells = sharks[blocked], cells[blocked]
+    store.energy[stuck] -= 1
+    starving = store.energy[stuck] <= 0
+    planet.cells[stuck_cells[starving]] = EMPTY
+    planet.occupants[stuck_cells[starving]] = -1
+    store.die_many(stuck[starving])
+    planet.shark_population -= int(starving.sum())
+    planet.record_changes(stuck_cells[starving])
+
+
+def vectorized_step(planet) -> None:
+    """
+    Run the animal updates of one chronon: all fish first, then all sharks.
+
+    Args:
+        planet (WatorPlanet): The planet to update in place.
+    """
+
+    store = planet.store
+    move_fishes(planet, np.flatnonzero(planet.cells == FISH))
+    move_sharks(planet, np.flatnonzero(planet.cells == SHARK))
+    store.compact_if_fragmented()